@@ -62,6 +62,8 @@ class Config:
                 'verify_gpg_signatures': True,  # Verify GPG signatures when available
                 'gpg_strict_mode': False,  # Fail downloads if GPG verification fails (False = warn only)
                 'auto_import_gpg_keys': True,  # Automatically import distro GPG keys from keyservers
+                'max_parallel_downloads': 4,  # Concurrent ISO downloads when refreshing outdated ISOs
+                'keep_backup': False,  # Keep the replaced ISO as <name>.backup when refreshing
             },
             'metadata': {
                 'auto_update_on_startup': True,  # Automatically update distro metadata with GPG verification
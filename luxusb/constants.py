@@ -238,6 +238,9 @@ class Size:
     # Common partition sizes
     EFI_PARTITION_MB: Final = 1024  # 1 GB for EFI
     MIN_USB_SIZE_GB: Final = 8  # Minimum 8GB USB
+    
+    # Read size for streamed ISO downloads (hashed in the same pass)
+    DOWNLOAD_CHUNK: Final = 1024 * 1024
 
 
 class Timeout:
@@ -254,6 +257,7 @@ class Interval:
     PROGRESS_UPDATE_MS: Final = 100  # 100ms for smooth progress
     TOAST_TIMEOUT: Final = 5  # 5 seconds
     CACHE_TTL_HOURS: Final = 24
+    NETWORK_PROBE_TTL: Final = 60  # Reuse connectivity probe result for 60 seconds
 
 
 # ============================================================================
@@ -265,6 +269,8 @@ class PathPattern:
     CONFIG_DIR: Final = ".config/luxusb"
     DATA_DIR: Final = ".local/share/luxusb"
     CACHE_DIR: Final = ".cache/luxusb"
+    COSIGN_KEY_CACHE_DIR: Final = ".cache/luxusb/cosign_keys"
+    COSIGN_RESULT_DB: Final = ".cache/luxusb/cosign_results.db"
     LOG_DIR: Final = ".local/share/luxusb/logs"
     
     # File names
@@ -272,6 +278,7 @@ class PathPattern:
     LOG_FILE: Final = "luxusb.log"
     MIRROR_STATS_FILE: Final = "mirror_stats.json"
     UPDATE_MARKER_FILE: Final = "last_metadata_update.json"
+    DISTRO_CACHE_FILE: Final = "distros.cache.json"
 
 
 # ============================================================================
@@ -2,17 +2,67 @@
 GUI package initialization with consolidated GTK imports
 """
 
+import logging
 import sys
+from concurrent.futures import Future
+from typing import Any, Callable
+
 import gi
 
 # Require specific versions before importing
 try:
     gi.require_version('Gtk', '4.0')
     gi.require_version('Adw', '1')
-    from gi.repository import Gtk, Adw, GLib, Gio, GdkPixbuf, Gdk
+    from gi.repository import Gtk, Adw, GLib, Gio, GObject, GdkPixbuf, Gdk
 except (ImportError, ValueError) as exc:
     print(f'Error: GTK4/Libadwaita dependencies not met: {exc}', file=sys.stderr)
     sys.exit(1)
 
+from luxusb.utils._daemon_pool import DaemonThreadPool
+
+logger = logging.getLogger(__name__)
+
+# Daemon worker threads shared by the update workflows, reused across runs
+_WORKFLOW_POOL = DaemonThreadPool(max_workers=2, thread_name_prefix="luxusb-update")
+
+
+def _log_workflow_crash(future: Future) -> None:
+    """Surface exceptions that escaped a workflow job"""
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Update workflow crashed", exc_info=exc)
+
+
+def submit_workflow(fn: Callable, *args: Any) -> Future:
+    """
+    Run a long-lived update workflow on the shared workflow pool
+    
+    The pool's workers are daemon threads, so closing the window
+    mid-download exits instead of waiting for the workflow to finish.
+    """
+    future = _WORKFLOW_POOL.submit(fn, *args)
+    future.add_done_callback(_log_workflow_crash)
+    return future
+
+
+def clear_list_box(list_box: 'Gtk.ListBox') -> None:
+    """Remove all rows from a list box in one batch"""
+    if hasattr(list_box, 'remove_all'):  # GTK 4.12+
+        list_box.remove_all()
+        return
+    
+    # Collect first, then remove from the end so siblings aren't re-indexed
+    rows = []
+    child = list_box.get_first_child()
+    while child is not None:
+        if isinstance(child, Gtk.ListBoxRow):
+            rows.append(child)
+        child = child.get_next_sibling()
+    for row in reversed(rows):
+        list_box.remove(row)
+
+
 # Export for use in other modules
-__all__ = ['Gtk', 'Adw', 'GLib', 'Gio', 'GdkPixbuf', 'Gdk']
+__all__ = ['Gtk', 'Adw', 'GLib', 'Gio', 'GObject', 'GdkPixbuf', 'Gdk', 'clear_list_box', 'submit_workflow']
@@ -0,0 +1,190 @@
+"""
+Shared progress window used by the update workflows
+"""
+
+from collections import deque
+from threading import Lock
+from typing import Any, Sequence, Tuple
+
+from luxusb.gui import Gtk, GLib
+
+# Style markers prepended to log lines
+_LOG_PREFIX = {
+    "success": "✅ ",
+    "error": "❌ ",
+    "info": "ℹ️  ",
+    "progress": "🔄 ",
+    "normal": "",
+}
+
+
+class BaseProgressDialog(Gtk.Window):
+    """Modal window with a progress bar, status label and scrolling log"""
+    
+    # Rolling cap on log view lines so long runs don't grow the buffer unbounded
+    MAX_LOG_LINES = 2000
+    # Status label text when every item succeeded
+    SUCCESS_STATUS = "All items updated successfully!"
+    
+    def __init__(
+        self,
+        parent: Gtk.Window,
+        title: str,
+        heading: str,
+        default_size: Tuple[int, int],
+        items: Sequence[Any],
+        status_width_chars: int = 50,
+        log_min_height: int = 150
+    ) -> None:
+        super().__init__()
+        self.set_transient_for(parent)
+        self.set_modal(True)
+        self.set_title(title)
+        self.set_default_size(*default_size)
+        self.set_resizable(False)
+        
+        # Main container
+        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
+        box.set_margin_top(24)
+        box.set_margin_bottom(24)
+        box.set_margin_start(24)
+        box.set_margin_end(24)
+        
+        # Title
+        title_label = Gtk.Label()
+        title_label.set_markup(f"<big><b>{GLib.markup_escape_text(heading)}</b></big>")
+        box.append(title_label)
+        
+        # Progress bar
+        self.progress_bar = Gtk.ProgressBar()
+        self.progress_bar.set_show_text(True)
+        self.progress_bar.set_text("Starting...")
+        box.append(self.progress_bar)
+        
+        # Status label
+        self.status_label = Gtk.Label()
+        self.status_label.set_wrap(True)
+        self.status_label.set_max_width_chars(status_width_chars)
+        self.status_label.set_xalign(0.0)
+        box.append(self.status_label)
+        
+        # Scrolled window for log messages
+        scrolled = Gtk.ScrolledWindow()
+        scrolled.set_vexpand(True)
+        scrolled.set_min_content_height(log_min_height)
+        
+        self.log_view = Gtk.TextView()
+        self.log_view.set_editable(False)
+        self.log_view.set_wrap_mode(Gtk.WrapMode.WORD)
+        self.log_view.set_monospace(True)
+        self.log_buffer = self.log_view.get_buffer()
+        # Right-gravity mark that stays at the end of the buffer as text is added
+        self._end_mark = self.log_buffer.create_mark("end", self.log_buffer.get_end_iter(), False)
+        scrolled.set_child(self.log_view)
+        
+        # Log lines queued from any thread, inserted by one idle flush
+        self._log_lock = Lock()
+        self._log_queue: deque[str] = deque()
+        self._flush_scheduled = False
+        box.append(scrolled)
+        
+        # Close button (initially disabled)
+        button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
+        button_box.set_halign(Gtk.Align.END)
+        
+        self.close_button = Gtk.Button(label="Close")
+        self.close_button.set_sensitive(False)
+        self.close_button.connect("clicked", lambda _: self.close())
+        button_box.append(self.close_button)
+        
+        box.append(button_box)
+        
+        self.set_child(box)
+        
+        # Store item list
+        self.items = items
+        self.total_items = len(items)
+        self.success_count = 0
+        self.error_count = 0
+        self._last_fraction = -1.0
+    
+    def update_progress(self, fraction: float, text: str) -> None:
+        """Update progress bar (call from main thread via GLib.idle_add)"""
+        self.progress_bar.set_fraction(fraction)
+        self.progress_bar.set_text(text)
+    
+    def update_status(self, status: str) -> None:
+        """Update status label"""
+        self.status_label.set_text(status)
+    
+    def apply_step(self, fraction: float, progress_text: str, status_text: str) -> bool:
+        """Update progress bar and status label in one main-loop turn"""
+        # Only move the bar when the change is at least one pixel wide
+        if abs(fraction - self._last_fraction) >= 1.0 / max(self.progress_bar.get_width(), 100):
+            self._last_fraction = fraction
+            self.progress_bar.set_fraction(fraction)
+        self.progress_bar.set_text(progress_text)
+        self.status_label.set_text(status_text)
+        return False
+    
+    def post_step(self, fraction: float, progress_text: str, status_text: str) -> None:
+        """Schedule apply_step from a worker thread, ahead of pending log flushes"""
+        GLib.idle_add(
+            self.apply_step,
+            fraction,
+            progress_text,
+            status_text,
+            priority=GLib.PRIORITY_DEFAULT
+        )
+    
+    def append_log(self, message: str, style: str = "normal") -> None:
+        """Append message to log view (safe to call from any thread)"""
+        with self._log_lock:
+            self._log_queue.append(_LOG_PREFIX.get(style, "") + message)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        # Below progress updates so a log burst can't hold the bar back
+        GLib.idle_add(self._flush_log, priority=GLib.PRIORITY_LOW)
+    
+    def _flush_log(self) -> bool:
+        """Insert all queued log lines at once (GTK main thread)"""
+        with self._log_lock:
+            pending = list(self._log_queue)
+            self._log_queue.clear()
+            self._flush_scheduled = False
+        
+        # Group the insert and trim so the view sees one change per flush
+        self.log_view.freeze_notify()
+        self.log_buffer.begin_user_action()
+        try:
+            # Clicks in the view can move the cursor, so re-anchor it at the end
+            self.log_buffer.place_cursor(self.log_buffer.get_end_iter())
+            self.log_buffer.insert_at_cursor("\n".join(pending) + "\n")
+            
+            # Keep only the most recent MAX_LOG_LINES lines
+            excess = self.log_buffer.get_line_count() - self.MAX_LOG_LINES
+            if excess > 0:
+                _found, cut = self.log_buffer.get_iter_at_line(excess)
+                self.log_buffer.delete(self.log_buffer.get_start_iter(), cut)
+        finally:
+            self.log_buffer.end_user_action()
+            self.log_view.thaw_notify()
+        
+        # Auto-scroll to bottom
+        self.log_view.scroll_to_mark(self._end_mark, 0.0, True, 0.0, 1.0)
+        return False
+    
+    def mark_complete(self, success_count: int, error_count: int) -> None:
+        """Mark update process as complete"""
+        if error_count == 0:
+            self.progress_bar.set_fraction(1.0)
+            self.progress_bar.set_text(f"✅ Complete ({success_count} updated)")
+            self.update_status(self.SUCCESS_STATUS)
+        else:
+            self.progress_bar.set_fraction(1.0)
+            self.progress_bar.set_text(f"⚠️ Complete with errors")
+            self.update_status(f"{success_count} updated, {error_count} failed")
+        
+        # Enable close button
+        self.close_button.set_sensitive(True)
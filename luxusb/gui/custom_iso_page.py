@@ -3,7 +3,7 @@ Custom ISO selection page
 """
 
 import logging
-from luxusb.gui import Gtk, Adw, Gio
+from luxusb.gui import Gtk, Adw, Gio, clear_list_box
 from typing import Any
 from pathlib import Path
 
@@ -422,11 +422,7 @@ class CustomISOPage(Adw.NavigationPage):
         self.custom_isos.clear()
         
         # Clear UI
-        while True:
-            row = self.custom_iso_list.get_first_child()
-            if not row:
-                break
-            self.custom_iso_list.remove(row)
+        clear_list_box(self.custom_iso_list)
         
         self.update_summary()
     
@@ -3,7 +3,7 @@ USB device selection page
 """
 
 import logging
-from luxusb.gui import Gtk, Adw, GLib, GdkPixbuf, Gdk
+from luxusb.gui import Gtk, Adw, GLib, GdkPixbuf, Gdk, clear_list_box
 from typing import Any
 from pathlib import Path
 
@@ -73,11 +73,7 @@ class DeviceSelectionPage(Adw.NavigationPage):
         logger.info("Scanning for USB devices...")
         
         # Clear existing devices
-        while True:
-            row = self.device_list.get_row_at_index(0)
-            if row is None:
-                break
-            self.device_list.remove(row)
+        clear_list_box(self.device_list)
         
         # Scan devices
         devices = self.main_window.get_application().usb_detector.scan_devices()
@@ -3,7 +3,7 @@ Distribution selection page
 """
 
 import logging
-from luxusb.gui import Gtk, Adw, GLib
+from luxusb.gui import Gtk, Adw, GLib, clear_list_box
 from typing import Any
 
 from luxusb.utils.distro_manager import get_distro_manager, Distro, DistroSelection
@@ -252,11 +252,7 @@ class DistroSelectionPage(Adw.NavigationPage):
         logger.info("Loading distributions...")
         
         # Clear existing
-        while True:
-            row = self.distro_list.get_row_at_index(0)
-            if row is None:
-                break
-            self.distro_list.remove(row)
+        clear_list_box(self.distro_list)
         
         # Get all distros
         distros = get_distro_manager().get_all_distros()
@@ -3,8 +3,9 @@ Family selection page for distro wizard
 """
 
 import logging
-from luxusb.gui import Gtk, Adw, GLib
-from typing import Any
+from collections import Counter
+from luxusb.gui import Gtk, Adw, GLib, Gio, GObject
+from typing import Any, Optional
 import json
 from pathlib import Path
 
@@ -12,10 +13,99 @@ from luxusb.constants import DistroFamily
 
 logger = logging.getLogger(__name__)
 
+# Memoized "N distros available" strings, keyed by count
+_COUNT_LABELS: dict[int, str] = {}
+
+
+def _count_label(count: int) -> str:
+    """Return the pluralized distro count label for a family card"""
+    label = _COUNT_LABELS.get(count)
+    if label is None:
+        label = _COUNT_LABELS[count] = f"{count} distro{'' if count == 1 else 's'} available"
+    return label
+
+
+class FamilyItem(GObject.Object):
+    """List model item wrapping a single family entry"""
+    
+    def __init__(self, family_id: str, family_data: dict, count: int) -> None:
+        super().__init__()
+        self.family_id = family_id
+        self.family_data = family_data
+        self.count = count
+
+
+class FamilyCard(Gtk.Box):
+    """Card widget for one family, reused by the list view factory"""
+    
+    def __init__(self) -> None:
+        super().__init__(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+        self.add_css_class("card")
+        self.set_margin_top(4)
+        self.set_margin_bottom(4)
+        
+        box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+        box.set_hexpand(True)
+        box.set_margin_top(10)
+        box.set_margin_bottom(10)
+        box.set_margin_start(12)
+        box.set_margin_end(12)
+        
+        # Icon/Emoji
+        self.icon_label = Gtk.Label()
+        self.icon_label.add_css_class("title-3")
+        box.append(self.icon_label)
+        
+        # Text content
+        text_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
+        text_box.set_hexpand(True)
+        text_box.set_halign(Gtk.Align.START)
+        
+        # Family name
+        self.name_label = Gtk.Label()
+        self.name_label.set_halign(Gtk.Align.START)
+        self.name_label.add_css_class("title-4")
+        text_box.append(self.name_label)
+        
+        # Description
+        self.desc_label = Gtk.Label()
+        self.desc_label.set_halign(Gtk.Align.START)
+        self.desc_label.set_wrap(True)
+        self.desc_label.add_css_class("dim-label")
+        self.desc_label.add_css_class("caption")
+        text_box.append(self.desc_label)
+        
+        # Count
+        self.count_label = Gtk.Label()
+        self.count_label.set_halign(Gtk.Align.START)
+        self.count_label.add_css_class("dim-label")
+        self.count_label.add_css_class("caption")
+        text_box.append(self.count_label)
+        
+        box.append(text_box)
+        
+        # Arrow icon
+        arrow = Gtk.Image.new_from_icon_name("go-next-symbolic")
+        arrow.set_valign(Gtk.Align.CENTER)
+        box.append(arrow)
+        
+        self.append(box)
+    
+    def bind(self, item: FamilyItem) -> None:
+        """Show a family item's details on this card"""
+        family_data = item.family_data
+        self.icon_label.set_label(family_data.get('icon', '📦'))
+        self.name_label.set_label(family_data.get('display_name', item.family_id.capitalize()))
+        self.desc_label.set_label(family_data.get('description', ''))
+        self.count_label.set_label(_count_label(item.count))
+
 
 class FamilySelectionPage(Adw.NavigationPage):
     """Page for selecting distribution family"""
     
+    # Parsed families.json, shared across page instances
+    _families_cache: Optional[dict] = None
+    
     def __init__(self, main_window: Any) -> None:
         super().__init__()
         self.main_window = main_window
@@ -49,26 +139,26 @@ class FamilySelectionPage(Adw.NavigationPage):
         scrolled.set_vexpand(True)
         scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
         
-        # Use Clamp for better centering with max width
-        clamp = Adw.Clamp()
+        # Use ClampScrollable so the list view stays the scrollable child
+        clamp = Adw.ClampScrollable()
         clamp.set_maximum_size(600)
         clamp.set_tightening_threshold(400)
         
-        cards_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        cards_box.set_halign(Gtk.Align.FILL)
-        cards_box.set_valign(Gtk.Align.CENTER)
+        # Family cards are realized lazily by the list view factory
+        self.family_store = Gio.ListStore.new(FamilyItem)
+        self._populate_family_store()
         
-        # Create family cards in order
-        families_ordered = sorted(
-            self.families.items(),
-            key=lambda x: x[1].get('sort_order', 99)
-        )
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_card_setup)
+        factory.connect("bind", self._on_card_bind)
         
-        for family_id, family_data in families_ordered:
-            card = self.create_family_card(family_id, family_data)
-            cards_box.append(card)
+        cards_view = Gtk.ListView.new(Gtk.NoSelection.new(self.family_store), factory)
+        cards_view.set_single_click_activate(True)
+        cards_view.set_valign(Gtk.Align.CENTER)
+        cards_view.add_css_class("background")
+        cards_view.connect("activate", self.on_family_activated)
         
-        clamp.set_child(cards_box)
+        clamp.set_child(cards_view)
         scrolled.set_child(clamp)
         content.append(scrolled)
         
@@ -91,8 +181,20 @@ class FamilySelectionPage(Adw.NavigationPage):
         
         self.set_child(content)
     
-    def load_families(self) -> dict:
-        """Load family metadata from JSON"""
+    @classmethod
+    def load_families(cls, force_reload: bool = False) -> dict:
+        """
+        Load family metadata from JSON
+        
+        The parsed result is cached on the class so the page (and the
+        startup cache warmer) only read families.json once.
+        
+        Args:
+            force_reload: Re-read families.json even if already cached
+        """
+        if cls._families_cache is not None and not force_reload:
+            return cls._families_cache
+        
         try:
             data_dir = Path(__file__).parent.parent / "data"
             families_file = data_dir / "families.json"
@@ -100,15 +202,19 @@ class FamilySelectionPage(Adw.NavigationPage):
             if families_file.exists():
                 with open(families_file, 'r') as f:
                     data = json.load(f)
-                    return data.get('families', {})
+                    families = data.get('families', {})
             else:
                 logger.warning(f"Families file not found: {families_file}")
-                return self.get_default_families()
+                families = cls.get_default_families()
         except Exception as e:
             logger.error(f"Error loading families: {e}")
-            return self.get_default_families()
+            families = cls.get_default_families()
+        
+        cls._families_cache = families
+        return families
     
-    def get_default_families(self) -> dict:
+    @staticmethod
+    def get_default_families() -> dict:
         """Fallback family definitions using DistroFamily enum"""
         return {
             DistroFamily.ARCH.value: {
@@ -134,67 +240,45 @@ class FamilySelectionPage(Adw.NavigationPage):
             }
         }
     
-    def create_family_card(self, family_id: str, family_data: dict) -> Gtk.Button:
-        """Create an actionable card for a family"""
+    def reload(self) -> None:
+        """Re-read families.json and distro counts, then refresh the cards"""
+        self.families = self.load_families(force_reload=True)
+        self._populate_family_store()
+    
+    def _populate_family_store(self) -> None:
+        """Fill the family list model, ordered by sort_order"""
         from luxusb.utils.distro_manager import get_distro_manager
         
-        # Count distros in this family
+        # Count distros per family in a single pass
         all_distros = get_distro_manager().get_all_distros()
-        count = sum(1 for d in all_distros if hasattr(d, 'family') and d.family == family_id)
-        
-        # Create button that looks like a card
-        button = Gtk.Button()
-        button.add_css_class("card")
-        button.connect("clicked", self.on_family_selected, family_id)
-        
-        box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        box.set_margin_top(10)
-        box.set_margin_bottom(10)
-        box.set_margin_start(12)
-        box.set_margin_end(12)
-        
-        # Icon/Emoji
-        icon_label = Gtk.Label(label=family_data.get('icon', '📦'))
-        icon_label.add_css_class("title-3")
-        box.append(icon_label)
-        
-        # Text content
-        text_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
-        text_box.set_hexpand(True)
-        text_box.set_halign(Gtk.Align.START)
-        
-        # Family name
-        name_label = Gtk.Label(label=family_data.get('display_name', family_id.capitalize()))
-        name_label.set_halign(Gtk.Align.START)
-        name_label.add_css_class("title-4")
-        text_box.append(name_label)
-        
-        # Description
-        desc_label = Gtk.Label(label=family_data.get('description', ''))
-        desc_label.set_halign(Gtk.Align.START)
-        desc_label.set_wrap(True)
-        desc_label.add_css_class("dim-label")
-        desc_label.add_css_class("caption")
-        text_box.append(desc_label)
+        counts = Counter(getattr(d, 'family', None) for d in all_distros)
         
-        # Count
-        count_label = Gtk.Label(label=f"{count} distro{'s' if count != 1 else ''} available")
-        count_label.set_halign(Gtk.Align.START)
-        count_label.add_css_class("dim-label")
-        count_label.add_css_class("caption")
-        text_box.append(count_label)
-        
-        box.append(text_box)
-        
-        # Arrow icon
-        arrow = Gtk.Image.new_from_icon_name("go-next-symbolic")
-        arrow.set_valign(Gtk.Align.CENTER)
-        box.append(arrow)
+        families_ordered = sorted(
+            self.families.items(),
+            key=lambda x: x[1].get('sort_order', 99)
+        )
         
-        button.set_child(box)
-        return button
+        items = [
+            FamilyItem(family_id, family_data, counts[family_id])
+            for family_id, family_data in families_ordered
+        ]
+        self.family_store.splice(0, self.family_store.get_n_items(), items)
+    
+    def _on_card_setup(self, _factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+        """Create a reusable card widget for a list item"""
+        list_item.set_child(FamilyCard())
+    
+    def _on_card_bind(self, _factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+        """Populate a recycled card widget from its family item"""
+        list_item.get_child().bind(list_item.get_item())
+    
+    def on_family_activated(self, _list_view: Gtk.ListView, position: int) -> None:
+        """Handle activation of a family card"""
+        item = self.family_store.get_item(position)
+        if item is not None:
+            self.on_family_selected(None, item.family_id)
     
-    def on_family_selected(self, _button: Gtk.Button, family_id: str) -> None:
+    def on_family_selected(self, _button: Optional[Gtk.Button], family_id: str) -> None:
         """Handle family selection"""
         logger.info(f"Selected family: {family_id}")
         
@@ -2,31 +2,61 @@
 Main GTK4 application window
 """
 
+import json
 import logging
+import queue
+import time
+from concurrent.futures import Future
+from datetime import datetime
+from functools import cache, cached_property, partial
+from pathlib import Path
 from typing import Optional, Callable, Any
-from threading import Thread
+from threading import Lock
 
-from luxusb.gui import Gtk, Adw, GLib, Gio
+from luxusb.gui import Gtk, Adw, GLib, Gio, submit_workflow
 
 from luxusb import APP_NAME, APP_ID
 from luxusb._version import __version__
 from luxusb.utils.usb_detector import USBDetector, USBDevice
-from luxusb.utils.distro_manager import DistroSelection
+from luxusb.utils.distro_manager import DistroSelection, get_distro_manager
+from luxusb.utils.distro_json_loader import get_distro_loader
 from luxusb.utils.custom_iso import CustomISO
 from luxusb.utils.secure_boot import detect_secure_boot
+from luxusb.utils.network_detector import is_network_available
+from luxusb.utils.update_scheduler import UpdateScheduler
+from luxusb.utils.distro_updater import DistroUpdater
+from luxusb.utils.distro_validator import DistroValidator
+from luxusb.utils._daemon_pool import DaemonThreadPool
+from luxusb.config import config
 from luxusb.gui.splash import SplashWindow
 from luxusb.gui.device_page import DeviceSelectionPage
 from luxusb.gui.family_page import FamilySelectionPage
 from luxusb.gui.distro_page import DistroSelectionPage
 from luxusb.gui.progress_page import ProgressPage
+from luxusb.gui.update_dialog import UpdateNotificationDialog, UpdateWorkflow
 from luxusb.constants import ConfigKeys, Interval, PathPattern
 
 logger = logging.getLogger(__name__)
 
 
+@cache
+def _preferences_dialog_module():
+    """
+    Import the preferences dialog module on first use
+    
+    Its widget template is read from disk at import time, and most
+    sessions never open Preferences.
+    """
+    from luxusb.gui import preferences_dialog
+    return preferences_dialog
+
+
 class LUXusbApplication(Adw.Application):
     """Main application class"""
     
+    # Maximum number of queued UI callbacks run per idle iteration
+    UI_QUEUE_BATCH = 16
+    
     def __init__(self) -> None:
         super().__init__(application_id=APP_ID)
         self.window: Optional[MainWindow] = None
@@ -38,6 +68,17 @@ class LUXusbApplication(Adw.Application):
         self.enable_secure_boot = False
         self.append_mode = False  # Whether to append to existing USB or create fresh
         
+        # Shared, bounded worker pool for background jobs; daemon workers, so
+        # a slow network probe or metadata check never delays exit
+        self._pool = DaemonThreadPool(max_workers=2, thread_name_prefix="luxusb-bg")
+        self._update_in_flight: dict[bool, Future] = {}  # require_network -> latest updater run
+        self._network_probe: Optional[tuple[float, bool]] = None  # (monotonic time, online)
+        
+        # Single-slot dispatcher for UI work posted from background threads
+        self._ui_queue: queue.Queue = queue.Queue()
+        self._ui_lock = Lock()
+        self._idle_installed = False
+        
         # Detect Secure Boot status
         self.secure_boot_status = detect_secure_boot()
         if self.secure_boot_status.is_active:
@@ -46,6 +87,57 @@ class LUXusbApplication(Adw.Application):
         
         # Register actions
         self._setup_actions()
+        
+        # Warm data caches while the splash screen is showing
+        self._pool.submit(self._warm_caches)
+    
+    def _warm_caches(self) -> None:
+        """Preload distro and family metadata in a background thread"""
+        try:
+            FamilySelectionPage.load_families()
+            get_distro_manager().get_all_distros()
+            logger.debug("Distro and family caches warmed")
+        except Exception as e:
+            logger.debug(f"Cache warm-up failed: {e}")
+    
+    @cached_property
+    def _scheduler(self) -> UpdateScheduler:
+        """Update scheduler shared by all update callbacks"""
+        return UpdateScheduler()
+    
+    def post(self, callback: Callable, *args: Any) -> None:
+        """
+        Queue a callback to run on the GTK main thread
+        
+        Safe to call from any thread. Bursts of posts share a single idle
+        handler instead of installing one idle source per callback. Posted
+        work originates in the background, so it runs at low priority and
+        never preempts redraws or input handling.
+        """
+        self._ui_queue.put((callback, args))
+        with self._ui_lock:
+            if self._idle_installed:
+                return
+            self._idle_installed = True
+        GLib.idle_add(self._drain_ui_queue, priority=GLib.PRIORITY_LOW)
+    
+    def _drain_ui_queue(self) -> bool:
+        """Run queued UI callbacks (main thread)"""
+        for _ in range(self.UI_QUEUE_BATCH):
+            try:
+                callback, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.exception(f"UI callback failed: {e}")
+        
+        with self._ui_lock:
+            if self._ui_queue.empty():
+                self._idle_installed = False
+                return False  # Nothing left, remove idle source
+        return True  # More pending, run again on next idle
     
     def do_activate(self) -> None:
         """Called when application is activated"""
@@ -55,11 +147,91 @@ class LUXusbApplication(Adw.Application):
             self.splash.set_application(self)
             self.splash.present()
             
-            # Start background metadata check
-            Thread(target=self._check_metadata_updates, daemon=True).start()
+            # Start background metadata check only if one is due
+            if self._should_check_metadata():
+                self._pool.submit(self._check_metadata_updates)
             
-            # Load main window after a short delay (simulates loading time)
-            GLib.timeout_add(1500, self._show_main_window)
+            # Build the main window as soon as the splash has been drawn
+            GLib.idle_add(self._show_main_window, priority=GLib.PRIORITY_LOW)
+    
+    def do_shutdown(self) -> None:
+        """Called when application is shutting down"""
+        self._pool.shutdown(cancel_futures=True)
+        Adw.Application.do_shutdown(self)
+    
+    def submit_background(self, fn: Callable, *args: Any) -> Future:
+        """Run a job on the shared background worker pool"""
+        return self._pool.submit(fn, *args)
+    
+    def _is_network_available(self) -> bool:
+        """
+        Check network connectivity, reusing a recent probe result
+        
+        Probes block for up to a second per test host, so callers on
+        the worker pool share one result for Interval.NETWORK_PROBE_TTL.
+        """
+        now = time.monotonic()
+        probe = self._network_probe
+        if probe is not None and now - probe[0] < Interval.NETWORK_PROBE_TTL:
+            return probe[1]
+        
+        online = is_network_available(timeout=1.0)
+        self._network_probe = (now, online)
+        return online
+    
+    def _is_update_in_flight(self) -> bool:
+        """Check whether a DistroUpdater run is already in progress"""
+        return any(not f.done() for f in self._update_in_flight.values())
+    
+    def _run_update_all(
+        self,
+        on_done: Callable[[dict], None],
+        on_error: Optional[Callable[[str], None]] = None,
+        require_network: bool = False
+    ) -> Future:
+        """
+        Run DistroUpdater.update_all() in the background (main thread only)
+        
+        Overlapping callers with the same require_network share the run
+        already in flight instead of starting a second one, so they all
+        receive the same results. A manual check never joins a run that
+        skips when offline, which would hand it empty results.
+        The run uses a daemon workflow thread rather than the worker
+        pool, so quitting mid-update doesn't wait on its downloads.
+        
+        Args:
+            on_done: Called on the main thread with the results dict
+            on_error: Optional, called on the main thread with the error message
+            require_network: Skip the update (empty results) when offline
+        
+        Returns:
+            Future of the shared updater run
+        """
+        future = self._update_in_flight.get(require_network)
+        if future is None or future.done():
+            future = submit_workflow(self._update_all_worker, require_network)
+            self._update_in_flight[require_network] = future
+        
+        def deliver(f: Future) -> None:
+            error = f.exception()
+            if error is None:
+                self.post(on_done, f.result())
+            else:
+                logger.warning(f"Distribution update failed: {error}")
+                if on_error:
+                    self.post(on_error, str(error))
+        
+        future.add_done_callback(deliver)
+        return future
+    
+    def _update_all_worker(self, require_network: bool = False) -> dict:
+        """Fetch latest metadata for all distributions (worker thread)"""
+        if require_network and not self._is_network_available():
+            logger.info("Network unavailable - skipping distribution update")
+            return {}
+        
+        updater = DistroUpdater()
+        return updater.update_all()
     
     def _show_main_window(self) -> bool:
         """Show main window and close splash screen"""
@@ -67,6 +239,9 @@ class LUXusbApplication(Adw.Application):
         self.window = MainWindow(application=self)
         self.window.present()
         
+        # Check if updates are needed (show indicator) once the window is up
+        GLib.idle_add(self.window._check_update_status, priority=GLib.PRIORITY_LOW)
+        
         # Close splash screen
         if self.splash:
             self.splash.close_splash()
@@ -74,48 +249,58 @@ class LUXusbApplication(Adw.Application):
         
         return False  # Don't repeat
     
-    def _check_metadata_updates(self) -> None:
-        """Check for metadata updates in background thread (Phase 3 enhanced)"""
+    def _should_check_metadata(self) -> bool:
+        """
+        Decide whether a startup metadata check is due (main thread)
+        
+        Only consults the in-memory scheduler state, so the common
+        "nothing to do" path never schedules background work. The
+        network probe can block, so it stays in _check_metadata_updates.
+        """
         try:
-            from luxusb.utils.update_scheduler import UpdateScheduler
-            from luxusb.utils.network_detector import is_network_available
-            from luxusb.utils.distro_validator import DistroValidator
-            
-            # Initialize scheduler
-            scheduler = UpdateScheduler()
+            scheduler = self._scheduler
+            scheduler.reload_if_changed()
             
             # Check if auto-check is enabled
             if not scheduler.is_auto_check_enabled():
                 logger.info("Automatic update checks disabled")
-                return
-            
-            # Check network connectivity
-            if not is_network_available(timeout=2.0):
-                logger.info("Network unavailable - skipping update check")
-                return
+                return False
             
             # Check if we should run update check
             should_check, reason = scheduler.should_check_for_updates()
             if not should_check:
                 logger.info(f"Skipping update check: {reason}")
-                return
+                return False
             
             logger.info(f"Running update check: {reason}")
+            return True
+        
+        except Exception as e:
+            logger.exception(f"Metadata check failed: {e}")
+            return False
+    
+    def _check_metadata_updates(self) -> None:
+        """Check for metadata updates in background thread (Phase 3 enhanced)"""
+        try:
+            scheduler = self._scheduler
+            
+            # Check network connectivity
+            if not self._is_network_available():
+                logger.info("Network unavailable - skipping update check")
+                return
             
             # Run validation
             validator = DistroValidator()
             stale_distros, unverified = validator.check_metadata_freshness()
             
             # Filter out skipped versions
-            filtered_distros = []
-            for distro_id in stale_distros:
-                # Simplified - in real implementation, would parse version from metadata
-                if not scheduler.should_skip_version(distro_id, "unknown"):
-                    filtered_distros.append(distro_id)
+            # Simplified - in real implementation, would parse version from metadata
+            skipped = scheduler.get_skipped_versions()
+            filtered_distros = [d for d in stale_distros if (d, "unknown") not in skipped]
             
             if filtered_distros:
                 # Show update notification on main thread
-                GLib.idle_add(self._show_update_notification, filtered_distros)
+                self.post(self._show_update_notification, filtered_distros)
             else:
                 logger.info("All metadata up to date")
                 # Still mark check as completed even if nothing to update
@@ -129,19 +314,16 @@ class LUXusbApplication(Adw.Application):
         if not self.window:
             return False
         
-        from luxusb.gui.update_dialog import UpdateNotificationDialog, UpdateWorkflow
-        
         dialog = UpdateNotificationDialog(self.window, stale_distros)
-        dialog.connect("response", lambda d, response: self._handle_update_response(d, response, stale_distros))
+        dialog.connect("response", self._handle_update_response, stale_distros)
         dialog.present()
         
         return False  # Don't repeat
     
     def _handle_update_response(self, dialog: Adw.MessageDialog, response: str, stale_distros: list[str]) -> None:
         """Handle user response to update notification (Phase 3 enhanced)"""
-        from luxusb.utils.update_scheduler import UpdateScheduler
-        
-        scheduler = UpdateScheduler()
+        scheduler = self._scheduler
+        scheduler.reload_if_changed()
         
         if response == "update":
             # User wants to update now
@@ -167,13 +349,11 @@ class LUXusbApplication(Adw.Application):
             
             logger.info(f"Skipped updates for 30 days and versions: {stale_distros}")
             dialog.close()
-            
-            logger.info("User skipped update notification")
-            dialog.close()
     
     def _start_update_workflow(self, stale_distros: list[str]) -> None:
         """Start update workflow with progress dialog"""
-        from luxusb.gui.update_dialog import UpdateWorkflow
+        # MainWindow shows toasts through its overlay
+        add_toast = getattr(self.window, "add_toast", None) or self.window.toast_overlay.add_toast
         
         def on_complete(success_count: int, error_count: int):
             """Called when updates complete"""
@@ -181,14 +361,11 @@ class LUXusbApplication(Adw.Application):
                 # Show success toast
                 toast = Adw.Toast.new(f"✅ {success_count} distribution(s) updated")
                 toast.set_timeout(3)
-                if hasattr(self.window, 'add_toast'):
-                    self.window.add_toast(toast)
             else:
                 # Show warning toast
                 toast = Adw.Toast.new(f"⚠️ {success_count} updated, {error_count} failed")
                 toast.set_timeout(5)
-                if hasattr(self.window, 'add_toast'):
-                    self.window.add_toast(toast)
+            add_toast(toast)
         
         workflow = UpdateWorkflow(self.window, stale_distros, on_complete)
         workflow.start()
@@ -232,20 +409,11 @@ class LUXusbApplication(Adw.Application):
         
         dialog.present()
         
-        # Run update check in background thread
-        def check_updates_thread():
-            try:
-                from luxusb.utils.distro_updater import DistroUpdater
-                updater = DistroUpdater()
-                results = updater.update_all()
-                
-                # Update UI on main thread
-                GLib.idle_add(lambda: self._show_update_results(dialog, results))
-            except Exception as e:
-                logger.exception(f"Update check failed: {e}")
-                GLib.idle_add(lambda: self._show_update_error(dialog, str(e)))
-        
-        Thread(target=check_updates_thread, daemon=True).start()
+        # Run update check in background (joins a run already in progress)
+        self._run_update_all(
+            partial(self._show_update_results, dialog),
+            partial(self._show_update_error, dialog)
+        )
     
     def _show_update_results(self, dialog: Adw.MessageDialog, results: dict) -> None:
         """Show update check results"""
@@ -262,14 +430,11 @@ class LUXusbApplication(Adw.Application):
             toast_msg = f"✓ Updated {success_count} of {total} distributions"
             toast = Adw.Toast.new(toast_msg)
             toast.set_timeout(5)
-            self.toast_overlay.add_toast(toast)
+            self.window.toast_overlay.add_toast(toast)
             logger.info(toast_msg)
             
-            # Hot-reload distros in the UI without restart
-            self._reload_distro_lists()
-            
-            # Clear update indicator
-            self._show_update_indicator(False)
+            # Reload distro lists and clear the indicator before the dialog
+            self.window._apply_update_results_ui(results)
         
         # Show detailed dialog
         result_msg = f"Updated {success_count} of {total} distributions."
@@ -304,9 +469,7 @@ class LUXusbApplication(Adw.Application):
         if not self.window:
             return
         
-        from luxusb.gui.preferences_dialog import PreferencesDialog
-        
-        prefs = PreferencesDialog(self.window)
+        prefs = _preferences_dialog_module().get_preferences_dialog(self.window)
         prefs.present()
     
     def on_about(self, _action, _param) -> None:
@@ -338,11 +501,21 @@ class MainWindow(Adw.ApplicationWindow):
         self.set_title(APP_NAME)
         self.set_default_size(900, 700)
         
+        # Last state applied by _show_update_indicator (None = never set)
+        self._update_indicator_state: Optional[bool] = None
+        
+        # Signature of the update results last applied by _reload_distro_lists
+        self._last_reload_sig: Optional[frozenset] = None
+        
+        # Set once the user toggles the theme, so the saved preference
+        # loading in the background doesn't override their choice
+        self._theme_chosen = False
+        
         # Get style manager for theme switching
         self.style_manager = Adw.StyleManager.get_default()
         
-        # Load and apply saved theme preference
-        self._load_theme_preference()
+        # Follow the system scheme until the saved preference is read
+        self.style_manager.set_color_scheme(Adw.ColorScheme.DEFAULT)
         
         # Create header bar
         header = Adw.HeaderBar()
@@ -362,9 +535,6 @@ class MainWindow(Adw.ApplicationWindow):
         
         header.pack_end(menu_button)
         
-        # Check if updates are needed (show indicator)
-        GLib.timeout_add_seconds(2, self._check_update_status)
-        
         # Light/Dark mode toggle button
         theme_button = Gtk.Button()
         theme_button.set_icon_name("weather-clear-night-symbolic")
@@ -421,6 +591,9 @@ class MainWindow(Adw.ApplicationWindow):
         
         self.set_content(main_box)
         
+        # Load and apply saved theme preference without blocking first paint
+        app.submit_background(self._load_theme_preference, app)
+        
         # Start periodic update checker using interval constant
         GLib.timeout_add_seconds(Interval.PERIODIC_UPDATE_CHECK, self._periodic_update_check)
         logger.info(f"Started periodic update checker (every {Interval.PERIODIC_UPDATE_CHECK // 3600} hours)")
@@ -493,11 +666,21 @@ class MainWindow(Adw.ApplicationWindow):
             logger.info("Refreshing distro list to reflect Secure Boot change")
             current_page.refresh_distros()
     
-    def _load_theme_preference(self) -> None:
-        """Load theme preference from config and apply it"""
-        from luxusb.config import config
+    def _load_theme_preference(self, app: 'LUXusbApplication') -> None:
+        """
+        Load theme preference from config (worker thread)
         
+        The application is passed in from the main thread, since GTK
+        getters like get_application() must not be called from here.
+        """
         theme = config.get(ConfigKeys.UI.THEME, default='dark')
+        app.post(self._apply_theme, theme)
+    
+    def _apply_theme(self, theme: str) -> None:
+        """Apply a loaded theme preference (main thread)"""
+        if self._theme_chosen:
+            logger.debug("Theme toggled before preference loaded, keeping user choice")
+            return
         
         if theme == 'dark':
             self.style_manager.set_color_scheme(Adw.ColorScheme.FORCE_DARK)
@@ -509,28 +692,32 @@ class MainWindow(Adw.ApplicationWindow):
             # 'auto' or unknown - use system preference
             self.style_manager.set_color_scheme(Adw.ColorScheme.DEFAULT)
             logger.info("Using system theme preference")
+        
+        self.update_theme_icon()
     
     def _save_theme_preference(self, theme: str) -> None:
-        """Save theme preference to config"""
-        from luxusb.config import config
-        
+        """Save theme preference to config (worker thread)"""
         config.set('ui.theme', theme)
         config.save()
         logger.info(f"Saved theme preference: {theme}")
     
     def on_theme_toggle_clicked(self, _button: Gtk.Button) -> None:
         """Toggle between light and dark themes"""
+        self._theme_chosen = True
         current_scheme = self.style_manager.get_color_scheme()
         
         # Toggle between light and dark (skip 'default'/system preference)
         if current_scheme == Adw.ColorScheme.FORCE_LIGHT:
             self.style_manager.set_color_scheme(Adw.ColorScheme.FORCE_DARK)
             logger.info("Switched to dark mode")
-            self._save_theme_preference('dark')
+            theme = 'dark'
         else:
             self.style_manager.set_color_scheme(Adw.ColorScheme.FORCE_LIGHT)
             logger.info("Switched to light mode")
-            self._save_theme_preference('light')
+            theme = 'light'
+        
+        # Write config in the background so the click returns immediately
+        self.get_application().submit_background(self._save_theme_preference, theme)
         
         # Update button icon
         self.update_theme_icon()
@@ -551,39 +738,33 @@ class MainWindow(Adw.ApplicationWindow):
     def _periodic_update_check(self) -> bool:
         """Periodically check for updates in the background"""
         try:
-            from luxusb.config import Config
-            config = Config()
             
             # Check if auto-update is enabled using constant
             if not config.get(ConfigKeys.Metadata.AUTO_UPDATE_ON_STARTUP, default=True):
                 return True  # Keep timer running
             
-            # Run update check silently
-            def silent_update_thread():
-                try:
-                    from luxusb.utils.distro_updater import DistroUpdater
-                    updater = DistroUpdater()
-                    results = updater.update_all()
-                    
-                    success_count = sum(1 for v in results.values() if v)
-                    if success_count > 0:
-                        # Show subtle notification
-                        GLib.idle_add(
-                            lambda: self._show_silent_update_notification(
-                                success_count
-                            )
-                        )
-                except Exception as e:
-                    logger.debug(f"Periodic update check failed: {e}")
+            # Don't stack updater runs on top of one already in progress
+            app = self.get_application()
+            if app._is_update_in_flight():
+                logger.debug("Update already in progress, skipping periodic check")
+                return True  # Keep timer running
             
-            Thread(target=silent_update_thread, daemon=True).start()
+            # Run update check silently
+            app._run_update_all(self._on_silent_update_done, require_network=True)
             
         except Exception as e:
             logger.debug(f"Periodic update check error: {e}")
         
         return True  # Keep timer running
     
-    def _show_silent_update_notification(self, count: int) -> None:
+    def _on_silent_update_done(self, results: dict) -> None:
+        """Handle results of a periodic background update"""
+        success_count = sum(1 for v in results.values() if v)
+        if success_count > 0:
+            # Show subtle notification
+            self._show_silent_update_notification(success_count, results)
+    
+    def _show_silent_update_notification(self, count: int, results: dict) -> None:
         """Show notification for background updates"""
         toast = Adw.Toast.new(
             f"🔄 {count} distribution(s) updated in background"
@@ -592,15 +773,45 @@ class MainWindow(Adw.ApplicationWindow):
         self.toast_overlay.add_toast(toast)
         
         # Hot-reload distros
-        self._reload_distro_lists()
+        self.get_application().post(self._reload_distro_lists, results)
         logger.info(f"Background update completed: {count} distros updated")
     
-    def _reload_distro_lists(self) -> None:
-        """Reload distribution lists in all pages without restart"""
+    def _apply_update_results_ui(self, results: dict) -> None:
+        """
+        Apply successful update results to the window in one pass
+        
+        Hot-reloads the distribution lists and clears the update
+        indicator together, so the window is re-laid out once.
+        """
+        self._reload_distro_lists(results)
+        self._show_update_indicator(False)
+    
+    def _reload_distro_lists(self, results: dict) -> None:
+        """
+        Reload distribution lists in all pages without restart
+        
+        Skipped when no distribution was updated, or when the updated
+        distro files are unchanged since the last reload, so no-op runs
+        don't rebuild the lists. The signature uses each updated file's
+        mtime, so a later update to the same distros still reloads.
+        
+        Args:
+            results: Update results (distro_id -> success) from DistroUpdater
+        """
+        data_dir = get_distro_loader().data_dir
+        signature = frozenset(
+            (distro_id, self._file_mtime(data_dir / f"{distro_id}.json"))
+            for distro_id, ok in results.items() if ok
+        )
+        if not signature or signature == self._last_reload_sig:
+            logger.debug("No distribution changes, skipping list reload")
+            return
+        self._last_reload_sig = signature
+        
         try:
             # Reload family page
             if hasattr(self, 'family_page'):
-                self.family_page.load_families()
+                self.family_page.reload()
                 logger.debug("Reloaded family page")
             
             # Reload distro page if it exists and is visible
@@ -611,15 +822,31 @@ class MainWindow(Adw.ApplicationWindow):
         except Exception as e:
             logger.warning(f"Failed to reload distro lists: {e}")
     
+    @staticmethod
+    def _file_mtime(path: Path) -> Optional[int]:
+        """Get a file's mtime in nanoseconds, or None if it can't be read"""
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+    
+    @staticmethod
+    def _read_last_update_time(update_marker: Path) -> Optional[float]:
+        """
+        Get last metadata update time (epoch seconds) from the update marker
+        
+        Returns None if the marker does not exist.
+        """
+        try:
+            with open(update_marker, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        return datetime.fromisoformat(data['timestamp']).timestamp()
+    
     def _check_update_status(self) -> bool:
         """Check if updates are available and show indicator"""
         try:
-            from luxusb.config import Config
-            from pathlib import Path
-            import json
-            from datetime import datetime, timedelta
-            
-            config = Config()
             update_frequency_days = config.get(
                 ConfigKeys.Metadata.UPDATE_FREQUENCY_DAYS, default=7
             )
@@ -631,19 +858,17 @@ class MainWindow(Adw.ApplicationWindow):
             cache_dir = Path.home() / PathPattern.CACHE_DIR
             update_marker = cache_dir / PathPattern.UPDATE_MARKER_FILE
             
-            if update_marker.exists():
-                with open(update_marker, 'r') as f:
-                    data = json.load(f)
-                    last_update = datetime.fromisoformat(data['timestamp'])
-                    days_since = (datetime.now() - last_update).days
-                    
-                    if days_since >= update_frequency_days:
-                        # Updates available
-                        self._show_update_indicator(True)
-                        logger.info(
-                            f"Updates available "
-                            f"({days_since} days since last update)"
-                        )
+            last_update = self._read_last_update_time(update_marker)
+            if last_update is not None:
+                days_since = int((time.time() - last_update) // 86400)
+                
+                if days_since >= update_frequency_days:
+                    # Updates available
+                    self._show_update_indicator(True)
+                    logger.info(
+                        f"Updates available "
+                        f"({days_since} days since last update)"
+                    )
             else:
                 # Never updated
                 self._show_update_indicator(True)
@@ -656,6 +881,10 @@ class MainWindow(Adw.ApplicationWindow):
     
     def _show_update_indicator(self, show: bool) -> None:
         """Show or hide update available indicator"""
+        if show == self._update_indicator_state:
+            return
+        self._update_indicator_state = show
+        
         if show:
             # Add suggested-action style class for visual indicator
             self.menu_button.add_css_class("suggested-action")
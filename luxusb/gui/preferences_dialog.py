@@ -3,199 +3,160 @@ Preferences dialog for update settings (Phase 3)
 """
 
 import logging
+import threading
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 
-from luxusb.gui import Gtk, Adw, GLib
+from luxusb.gui import Gtk, Adw, GLib, Gio, GObject
 
 from luxusb.utils.update_scheduler import UpdateScheduler
 
 logger = logging.getLogger(__name__)
 
+# Widget tree for PreferencesDialog, parsed once by GtkBuilder
+_UI_FILE = Path(__file__).with_suffix(".ui")
 
+# Delay before a check interval change is written to disk
+_INTERVAL_SAVE_DELAY_MS = 500
+
+
+@lru_cache(maxsize=8)
+def _format_check_time(iso_str: str) -> Optional[str]:
+    """Format an ISO timestamp for display (None if not a timestamp)"""
+    try:
+        return datetime.fromisoformat(iso_str).strftime("%B %d, %Y at %I:%M %p")
+    except (ValueError, TypeError):
+        return None
+
+
+class SkipEntry(GObject.Object):
+    """List model item wrapping a single skipped version"""
+    
+    def __init__(self, distro_id: str, version: str) -> None:
+        super().__init__()
+        self.distro_id = distro_id
+        self.version = version
+
+
+@Gtk.Template(filename=str(_UI_FILE))
 class PreferencesDialog(Adw.PreferencesWindow):
     """Preferences dialog for update settings"""
     
+    __gtype_name__ = "LuxusbPreferencesDialog"
+    
+    # Widgets defined in preferences_dialog.ui
+    auto_check_row = Gtk.Template.Child()
+    interval_row = Gtk.Template.Child()
+    last_check_row = Gtk.Template.Child()
+    next_check_row = Gtk.Template.Child()
+    skip_listbox = Gtk.Template.Child()
+    
     def __init__(self, parent: Gtk.Window):
         super().__init__()
         
         self.set_transient_for(parent)
-        self.set_modal(True)
-        self.set_default_size(600, 500)
         
-        self.scheduler = UpdateScheduler()
+        # Pending debounced interval save (GLib source ID)
+        self._interval_save_timeout_id: Optional[int] = None
         
-        self._build_ui()
-        self._load_preferences()
-    
-    def _build_ui(self) -> None:
-        """Build preference pages"""
-        
-        # Updates page
-        updates_page = Adw.PreferencesPage.new()
-        updates_page.set_title("Updates")
-        updates_page.set_icon_name("software-update-available-symbolic")
+        # Scheduler is loaded in the background (None until it arrives)
+        self.scheduler: Optional[UpdateScheduler] = None
         
-        # Automatic checks group
-        auto_group = Adw.PreferencesGroup.new()
-        auto_group.set_title("Automatic Checks")
-        auto_group.set_description("Configure when LUXusb checks for distribution metadata updates")
+        # Set while _load_preferences fills the widgets, so the change
+        # handlers don't write the just-loaded values straight back
+        self._loading = False
         
-        # Enable auto-check switch
-        self.auto_check_row = Adw.SwitchRow.new()
-        self.auto_check_row.set_title("Check for updates on startup")
-        self.auto_check_row.set_subtitle("Automatically check for new distribution metadata when LUXusb starts")
-        self.auto_check_row.connect("notify::active", self._on_auto_check_changed)
-        auto_group.add(self.auto_check_row)
+        # Skip list box, backed by a list model so rows are only
+        # created/destroyed for entries that actually change
+        self.skip_store = Gio.ListStore.new(SkipEntry)
+        self.skip_listbox.bind_model(self.skip_store, self._make_skip_row)
         
-        # Check interval spin button
-        self.interval_row = Adw.SpinRow.new_with_range(1, 30, 1)
-        self.interval_row.set_title("Check interval (days)")
-        self.interval_row.set_subtitle("How often to check for updates")
+        # Connected here rather than in the template so that applying the
+        # adjustment while the template is built doesn't schedule a save
         self.interval_row.connect("changed", self._on_interval_changed)
-        auto_group.add(self.interval_row)
-        
-        updates_page.add(auto_group)
-        
-        # Status group
-        status_group = Adw.PreferencesGroup.new()
-        status_group.set_title("Status")
-        status_group.set_description("Current update check status")
-        
-        # Last check row
-        self.last_check_row = Adw.ActionRow.new()
-        self.last_check_row.set_title("Last check")
-        self.last_check_row.set_subtitle("Never")
-        status_group.add(self.last_check_row)
-        
-        # Next check row
-        self.next_check_row = Adw.ActionRow.new()
-        self.next_check_row.set_title("Next check")
-        self.next_check_row.set_subtitle("On next startup")
-        status_group.add(self.next_check_row)
-        
-        updates_page.add(status_group)
-        
-        # Skipped versions group
-        skip_group = Adw.PreferencesGroup.new()
-        skip_group.set_title("Skipped Versions")
-        skip_group.set_description("Distributions you've chosen not to update")
-        
-        # Skip list box
-        self.skip_listbox = Gtk.ListBox.new()
-        self.skip_listbox.set_selection_mode(Gtk.SelectionMode.NONE)
-        self.skip_listbox.add_css_class("boxed-list")
-        skip_group.add(self.skip_listbox)
-        
-        # Clear skip list button
-        clear_button = Gtk.Button.new_with_label("Clear Skip List")
-        clear_button.add_css_class("destructive-action")
-        clear_button.connect("clicked", self._on_clear_skip_list)
-        
-        clear_box = Gtk.Box.new(Gtk.Orientation.HORIZONTAL, 0)
-        clear_box.set_halign(Gtk.Align.CENTER)
-        clear_box.set_margin_top(12)
-        clear_box.append(clear_button)
-        skip_group.add(clear_box)
-        
-        updates_page.add(skip_group)
-        
-        # Actions group
-        actions_group = Adw.PreferencesGroup.new()
-        actions_group.set_title("Actions")
-        
-        # Check now button
-        check_now_button = Gtk.Button.new_with_label("Check for Updates Now")
-        check_now_button.add_css_class("suggested-action")
-        check_now_button.connect("clicked", self._on_check_now)
-        
-        check_box = Gtk.Box.new(Gtk.Orientation.HORIZONTAL, 0)
-        check_box.set_halign(Gtk.Align.CENTER)
-        check_box.set_margin_top(12)
-        check_box.append(check_now_button)
-        actions_group.add(check_box)
         
-        updates_page.add(actions_group)
-        
-        self.add(updates_page)
+        # Read preferences off the main thread so the dialog shows immediately
+        self.last_check_row.set_subtitle("Loading…")
+        self.next_check_row.set_subtitle("Loading…")
+        threading.Thread(target=self._load_scheduler_async, daemon=True).start()
+    
+    def _load_scheduler_async(self) -> None:
+        """Load the update scheduler (background thread)"""
+        scheduler = UpdateScheduler()
+        stats = scheduler.get_statistics()
+        GLib.idle_add(self._apply_scheduler, scheduler, stats)
+    
+    def _apply_scheduler(self, scheduler: UpdateScheduler, stats: dict) -> bool:
+        """Populate the dialog from the loaded scheduler (GTK main thread)"""
+        self.scheduler = scheduler
+        self._load_preferences(stats)
+        return False
+    
+    def refresh(self) -> None:
+        """Reload displayed preferences if they changed on disk since last shown"""
+        if self.scheduler is not None and self.scheduler.reload_if_changed():
+            self._load_preferences()
     
-    def _load_preferences(self) -> None:
+    def _load_preferences(self, stats: Optional[dict] = None) -> None:
         """Load current preferences from scheduler"""
         prefs = self.scheduler.preferences
-        stats = self.scheduler.get_statistics()
-        
-        # Auto-check setting
-        self.auto_check_row.set_active(prefs.get('auto_check_on_startup', True))
-        
-        # Check interval
-        interval = prefs.get('check_interval_days', 7)
-        self.interval_row.set_value(interval)
-        
-        # Last check time
-        last_check = stats.get('last_check')
-        if last_check and last_check != "Never":
-            try:
-                last_dt = datetime.fromisoformat(last_check)
-                self.last_check_row.set_subtitle(last_dt.strftime("%B %d, %Y at %I:%M %p"))
-            except (ValueError, TypeError):
-                self.last_check_row.set_subtitle("Never")
-        else:
-            self.last_check_row.set_subtitle("Never")
-        
-        # Next check time
-        next_check = stats.get('next_check')
-        if next_check and next_check != "On next startup":
-            try:
-                next_dt = datetime.fromisoformat(next_check)
-                self.next_check_row.set_subtitle(next_dt.strftime("%B %d, %Y at %I:%M %p"))
-            except (ValueError, TypeError):
-                self.next_check_row.set_subtitle("On next startup")
-        else:
-            self.next_check_row.set_subtitle("On next startup")
+        if stats is None:
+            stats = self.scheduler.get_statistics()
+        
+        self._loading = True
+        try:
+            # Auto-check setting
+            self.auto_check_row.set_active(prefs.get('auto_check_on_startup', True))
+            
+            # Check interval
+            interval = prefs.get('check_interval_days', 7)
+            self.interval_row.set_value(interval)
+        finally:
+            self._loading = False
+        
+        # Last/next check time ("Never"/"On next startup" don't parse)
+        self.last_check_row.set_subtitle(
+            _format_check_time(stats.get('last_check') or "") or "Never"
+        )
+        self.next_check_row.set_subtitle(
+            _format_check_time(stats.get('next_check') or "") or "On next startup"
+        )
         
         # Skip list
         self._update_skip_list()
     
     def _update_skip_list(self) -> None:
         """Update skip list display"""
-        # Clear existing rows
-        while True:
-            row = self.skip_listbox.get_first_child()
-            if row is None:
-                break
-            self.skip_listbox.remove(row)
-        
-        # Get skip versions
-        skip_versions = self.scheduler.preferences.get('skip_versions', [])
-        
-        if not skip_versions:
-            # Show empty state
-            empty_row = Adw.ActionRow.new()
-            empty_row.set_title("No skipped versions")
-            empty_row.set_subtitle("You haven't skipped any distribution updates")
-            self.skip_listbox.append(empty_row)
-        else:
-            # Add rows for each skip version
-            for entry in skip_versions:
-                distro_id = entry.get('distro_id', 'Unknown')
-                version = entry.get('version', 'Unknown')
-                
-                row = Adw.ActionRow.new()
-                row.set_title(f"{distro_id}")
-                row.set_subtitle(f"Version: {version}")
-                
-                # Remove button
-                remove_btn = Gtk.Button.new_from_icon_name("user-trash-symbolic")
-                remove_btn.set_valign(Gtk.Align.CENTER)
-                remove_btn.add_css_class("flat")
-                remove_btn.set_tooltip_text("Remove from skip list")
-                remove_btn.connect("clicked", self._on_remove_skip, entry)
-                row.add_suffix(remove_btn)
-                
-                self.skip_listbox.append(row)
+        entries = [
+            SkipEntry(*UpdateScheduler.parse_skip_entry(entry))
+            for entry in self.scheduler.preferences.get('skip_versions', [])
+        ]
+        self.skip_store.splice(0, self.skip_store.get_n_items(), entries)
+    
+    def _make_skip_row(self, entry: SkipEntry) -> Gtk.Widget:
+        """Create the row for a skip list entry (bind_model callback)"""
+        row = Adw.ActionRow.new()
+        row.set_title(entry.distro_id or "Unknown")
+        row.set_subtitle(f"Version: {entry.version or 'Unknown'}")
+        
+        # Remove button
+        remove_btn = Gtk.Button.new_from_icon_name("user-trash-symbolic")
+        remove_btn.set_valign(Gtk.Align.CENTER)
+        remove_btn.add_css_class("flat")
+        remove_btn.set_tooltip_text("Remove from skip list")
+        remove_btn.connect("clicked", self._on_remove_skip, entry)
+        row.add_suffix(remove_btn)
+        
+        return row
     
+    @Gtk.Template.Callback()
     def _on_auto_check_changed(self, switch: Adw.SwitchRow, _param) -> None:
         """Handle auto-check toggle"""
+        if self.scheduler is None or self._loading:
+            return
+        
         enabled = switch.get_active()
         
         # Update scheduler
@@ -206,8 +167,20 @@ class PreferencesDialog(Adw.PreferencesWindow):
         logger.info(f"Auto-check on startup: {enabled}")
     
     def _on_interval_changed(self, spin: Adw.SpinRow) -> None:
-        """Handle interval change"""
-        interval = int(spin.get_value())
+        """Handle interval change (saved once the value settles)"""
+        if self.scheduler is None or self._loading:
+            return
+        
+        if self._interval_save_timeout_id is not None:
+            GLib.source_remove(self._interval_save_timeout_id)
+        
+        self._interval_save_timeout_id = GLib.timeout_add(
+            _INTERVAL_SAVE_DELAY_MS, self._commit_interval, int(spin.get_value())
+        )
+    
+    def _commit_interval(self, interval: int) -> bool:
+        """Save the settled check interval"""
+        self._interval_save_timeout_id = None
         
         # Update scheduler
         prefs = self.scheduler.preferences
@@ -215,21 +188,26 @@ class PreferencesDialog(Adw.PreferencesWindow):
         self.scheduler.save_preferences()
         
         logger.info(f"Check interval set to {interval} days")
+        return GLib.SOURCE_REMOVE
     
+    @Gtk.Template.Callback()
     def _on_check_now(self, _button: Gtk.Button) -> None:
         """Handle check now button"""
         # Close preferences and trigger update check
         self.close()
         
         # Emit signal to parent to run update check
-        # For now, just show toast
-        toast = Adw.Toast.new("Checking for updates...")
-        toast.set_timeout(2)
-        if self.get_transient_for():
-            parent = self.get_transient_for()
-            if hasattr(parent, 'add_toast'):
-                parent.add_toast(toast)
+        # For now, just show toast (only allocated if the parent can show it)
+        parent = self.get_transient_for()
+        add_toast = getattr(parent, 'add_toast', None)
+        if add_toast is None and hasattr(parent, 'toast_overlay'):
+            add_toast = parent.toast_overlay.add_toast
+        if add_toast is not None:
+            toast = Adw.Toast.new("Checking for updates...")
+            toast.set_timeout(2)
+            add_toast(toast)
     
+    @Gtk.Template.Callback()
     def _on_clear_skip_list(self, _button: Gtk.Button) -> None:
         """Handle clear skip list button"""
         # Confirmation dialog
@@ -244,29 +222,48 @@ class PreferencesDialog(Adw.PreferencesWindow):
         dialog.set_default_response("cancel")
         
         def on_response(_dialog, response):
-            if response == "clear":
+            if response == "clear" and self.scheduler is not None:
                 prefs = self.scheduler.preferences
                 prefs['skip_versions'] = []
                 prefs['skip_until_date'] = None
                 self.scheduler.save_preferences()
-                self._update_skip_list()
+                self.skip_store.remove_all()
                 logger.info("Skip list cleared")
         
         dialog.connect("response", on_response)
         dialog.present()
     
-    def _on_remove_skip(self, _button: Gtk.Button, entry: dict) -> None:
+    def _on_remove_skip(self, _button: Gtk.Button, entry: SkipEntry) -> None:
         """Handle remove skip entry"""
-        distro_id = entry.get('distro_id')
-        version = entry.get('version')
+        distro_id = entry.distro_id
+        version = entry.version
         
         # Remove from skip list
-        prefs = self.scheduler.preferences
-        skip_versions = prefs.get('skip_versions', [])
-        skip_versions = [s for s in skip_versions if not (s.get('distro_id') == distro_id and s.get('version') == version)]
-        prefs['skip_versions'] = skip_versions
-        self.scheduler.save_preferences()
+        self.scheduler.remove_skip_version(distro_id, version)
         
-        # Update display
-        self._update_skip_list()
-        logger.info(f"Removed {distro_id} {version} from skip list")
+        # Update display (only the removed row is destroyed)
+        found, position = self.skip_store.find(entry)
+        if found:
+            self.skip_store.remove(position)
+
+
+def get_preferences_dialog(parent: Gtk.Window) -> PreferencesDialog:
+    """
+    Get the preferences dialog for a window, creating it on first use
+    
+    The dialog is cached on the parent as ``_prefs_dialog``; later calls
+    only refresh its state instead of rebuilding the widget tree.
+    
+    Args:
+        parent: Window the dialog is transient for
+        
+    Returns:
+        PreferencesDialog ready to present
+    """
+    dialog = getattr(parent, '_prefs_dialog', None)
+    if dialog is None:
+        dialog = PreferencesDialog(parent)
+        parent._prefs_dialog = dialog
+    else:
+        dialog.refresh()
+    return dialog
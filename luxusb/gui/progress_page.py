@@ -3,6 +3,7 @@ Progress and installation page
 """
 
 import logging
+from collections import deque
 from luxusb.gui import Gtk, Adw, GLib
 import threading
 from pathlib import Path
@@ -12,6 +13,7 @@ from luxusb.utils.partitioner import USBPartitioner
 from luxusb.utils.downloader import ISODownloader, DownloadProgress
 from luxusb.utils.grub_installer import GRUBInstaller
 from luxusb.core.workflow import LUXusbWorkflow, WorkflowProgress
+from luxusb.gui.stale_iso_dialog import StaleISODialog, ISOUpdateWorkflow
 from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
@@ -20,6 +22,11 @@ logger = logging.getLogger(__name__)
 class ProgressPage(Adw.NavigationPage):
     """Page showing installation progress"""
     
+    # Maximum number of lines kept in the log view
+    MAX_LOG_LINES = 2000
+    # Trim the log only after this many appended lines to amortize deletes
+    LOG_TRIM_INTERVAL = 100
+    
     def __init__(self, main_window: Any) -> None:
         super().__init__()
         self.main_window = main_window
@@ -69,6 +76,9 @@ class ProgressPage(Adw.NavigationPage):
         self.log_view.set_cursor_visible(False)
         self.log_view.set_wrap_mode(Gtk.WrapMode.WORD)
         self.log_buffer = self.log_view.get_buffer()
+        # Right-gravity mark that stays at the end of the log for auto-scroll
+        self._end_mark = self.log_buffer.create_mark("end", self.log_buffer.get_end_iter(), False)
+        self._lines_since_trim = 0
         
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_vexpand(True)
@@ -87,6 +97,15 @@ class ProgressPage(Adw.NavigationPage):
         # Store workflow reference
         self.workflow: Optional[LUXusbWorkflow] = None
         self.is_downloading = False
+        self._workflow_has_grub_refresh = False
+        self._last_stage: Optional[str] = None
+        
+        # Status/log updates from worker threads, applied once per idle flush
+        self._pending_lock = threading.Lock()
+        self._pending_logs: deque[str] = deque()
+        self._pending_status: Optional[tuple[str, float]] = None
+        self._last_status: tuple[str, float] = ("", -1.0)
+        self._flush_scheduled = False
         
         self.set_child(content)
     
@@ -117,6 +136,7 @@ class ProgressPage(Adw.NavigationPage):
                 enable_secure_boot=enable_secure_boot,
                 append_mode=append_mode
             )
+            self._workflow_has_grub_refresh = hasattr(self.workflow, '_auto_refresh_grub_if_needed')
             
             # Set callback for outdated ISO detection
             self.workflow.outdated_iso_callback = self.on_outdated_isos_detected
@@ -155,7 +175,7 @@ class ProgressPage(Adw.NavigationPage):
         # Log stage changes
         if progress.current_stage:
             # Only log new stages, not every progress update
-            if not hasattr(self, '_last_stage') or self._last_stage != progress.current_stage:
+            if self._last_stage != progress.current_stage:
                 self.log(f"=== {progress.current_stage} ===")
                 self._last_stage = progress.current_stage
         
@@ -179,48 +199,63 @@ class ProgressPage(Adw.NavigationPage):
     
     def update_status(self, text: str, progress: float):
         """Update status label and progress bar"""
-        GLib.idle_add(self._update_status_ui, text, progress)
-    
-    def _update_status_ui(self, text: str, progress: float):
-        """Update status UI (GTK main thread)"""
-        self.status_label.set_text(text)
-        self.progress_bar.set_fraction(progress)
-        return False
+        key = (text, round(progress, 3))
+        with self._pending_lock:
+            if key == self._last_status:
+                return  # Nothing visible changed
+            self._last_status = key
+            self._pending_status = (text, progress)
+            self._schedule_flush()
     
     def log(self, message: str):
-        """Add message to log"""
-        GLib.idle_add(self._append_log, message)
+        """Add log message"""
+        with self._pending_lock:
+            self._pending_logs.append(message)
+            self._schedule_flush()
     
-    def _append_log(self, message: str):
-        """Append to log buffer (GTK main thread)"""
-        end_iter = self.log_buffer.get_end_iter()
-        self.log_buffer.insert(end_iter, message + "\n", -1)
+    def _schedule_flush(self) -> None:
+        """Install the flush idle callback if not already pending (lock held)"""
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            GLib.idle_add(self._flush_pending)
+    
+    def _flush_pending(self) -> bool:
+        """Apply all queued status and log updates at once (GTK main thread)"""
+        with self._pending_lock:
+            status = self._pending_status
+            self._pending_status = None
+            lines = list(self._pending_logs)
+            self._pending_logs.clear()
+            self._flush_scheduled = False
         
-        # Auto-scroll to bottom
-        mark = self.log_buffer.create_mark(None, end_iter, False)
-        self.log_view.scroll_to_mark(mark, 0.0, True, 0.0, 1.0)
-        self.log_buffer.delete_mark(mark)
+        if status is not None:
+            self._update_status_ui(*status)
+        if lines:
+            self._append_log("\n".join(lines))
         return False
     
     def _update_status_ui(self, text: str, progress: float):
-        """UI update for status (must run in main thread)"""
+        """Update status UI (GTK main thread)"""
         self.status_label.set_text(text)
         self.progress_bar.set_fraction(progress)
         return False
     
-    def log(self, message: str):
-        """Add log message"""
-        GLib.idle_add(self._log_ui, message)
-    
-    def _log_ui(self, message: str):
-        """UI update for log (must run in main thread)"""
+    def _append_log(self, message: str):
+        """Append to log buffer (GTK main thread)"""
         end_iter = self.log_buffer.get_end_iter()
-        self.log_buffer.insert(end_iter, message + "\n")
+        self.log_buffer.insert(end_iter, message + "\n", -1)
         
-        # Scroll to bottom
-        mark = self.log_buffer.get_insert()
-        self.log_view.scroll_to_mark(mark, 0.0, False, 0.0, 0.0)
+        # Keep only the most recent MAX_LOG_LINES lines
+        self._lines_since_trim += message.count("\n") + 1
+        if self._lines_since_trim >= self.LOG_TRIM_INTERVAL:
+            self._lines_since_trim = 0
+            excess = self.log_buffer.get_line_count() - self.MAX_LOG_LINES
+            if excess > 0:
+                _found, cut = self.log_buffer.get_iter_at_line(excess)
+                self.log_buffer.delete(self.log_buffer.get_start_iter(), cut)
         
+        # Auto-scroll to bottom
+        self.log_view.scroll_to_mark(self._end_mark, 0.0, True, 0.0, 1.0)
         return False
     
     def show_done_button(self) -> bool:
@@ -255,8 +290,6 @@ class ProgressPage(Adw.NavigationPage):
         Called from workflow when mounting existing USB in append mode
         """
         def show_dialog():
-            from luxusb.gui.stale_iso_dialog import StaleISODialog, ISOUpdateWorkflow
-            
             dialog = StaleISODialog(self.main_window, outdated_isos)
             dialog.connect("response", lambda d, response: self._handle_stale_iso_response(d, response, outdated_isos))
             dialog.present()
@@ -272,14 +305,12 @@ class ProgressPage(Adw.NavigationPage):
             # User wants to update ISOs
             self.log("Starting ISO update process...")
             
-            from luxusb.gui.stale_iso_dialog import ISOUpdateWorkflow
-            
             def on_complete(success_count: int, error_count: int):
                 if error_count == 0:
                     self.log(f"✓ {success_count} ISO(s) updated successfully")
                     # Auto-refresh GRUB config
                     self.log("Auto-refreshing GRUB configuration...")
-                    if hasattr(self.workflow, '_auto_refresh_grub_if_needed'):
+                    if self._workflow_has_grub_refresh:
                         self.workflow._auto_refresh_grub_if_needed()
                 else:
                     self.log(f"⚠️ {success_count} updated, {error_count} failed")
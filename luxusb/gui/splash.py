@@ -3,14 +3,37 @@ Splash screen for LUXusb application
 """
 
 import logging
+import os
 from pathlib import Path
 from typing import Optional
 
 from luxusb._version import __version__
-from luxusb.gui import Gtk, Gdk, GdkPixbuf
+from luxusb.gui import Gtk, Gdk, Gio, GLib
 
 logger = logging.getLogger(__name__)
 
+# Renderers where rounded corners and shadows are cheap to draw
+_GPU_RENDERERS = ("gl", "ngl", "vulkan")
+
+
+def _first_existing(*paths: Path) -> Optional[Path]:
+    """Return the first path that exists"""
+    return next((path for path in paths if path.exists()), None)
+
+
+# Splash images, resolved once at import instead of per splash
+try:
+    _ICON_PATH = _first_existing(
+        Path(__file__).parent.parent / "data" / "icons" / "com.luxusb.LUXusb.png",
+        Path.cwd() / "luxusb" / "data" / "icons" / "com.luxusb.LUXusb.png",
+    )
+except OSError:
+    _ICON_PATH = None
+
+_TEXT_LOGO_PATH = _first_existing(
+    Path(__file__).parent.parent.parent / "archive" / "images-source" / "luxusb-text-source.png",
+)
+
 
 class SplashWindow(Gtk.Window):
     """Splash screen window shown during application startup"""
@@ -39,15 +62,10 @@ class SplashWindow(Gtk.Window):
         
         # Load and display icon
         icon_path = self._find_icon()
-        if icon_path and icon_path.exists():
+        if icon_path:
             try:
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                    str(icon_path),
-                    180,  # width - reduced for narrower window
-                    180,  # height - reduced for narrower window
-                    True  # preserve aspect ratio
-                )
-                texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+                # Load unscaled; the image is scaled when drawn
+                texture = Gdk.Texture.new_from_file(Gio.File.new_for_path(str(icon_path)))
                 icon_image = Gtk.Image.new_from_paintable(texture)
                 icon_image.set_size_request(180, 180)  # Force minimum size
                 icon_image.set_pixel_size(180)  # Set pixel size
@@ -57,16 +75,10 @@ class SplashWindow(Gtk.Window):
         
         # Load and display text logo
         text_logo_path = self._find_text_logo()
-        if text_logo_path and text_logo_path.exists():
+        if text_logo_path:
             try:
-                # Text logo is 531x132, scale proportionally
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                    str(text_logo_path),
-                    300,  # width - reduced for narrower window
-                    75,   # height - maintains aspect ratio
-                    True  # preserve aspect ratio
-                )
-                texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+                # Text logo is 531x132, scaled proportionally when drawn
+                texture = Gdk.Texture.new_from_file(Gio.File.new_for_path(str(text_logo_path)))
                 text_image = Gtk.Image.new_from_paintable(texture)
                 text_image.set_size_request(300, 75)  # Force exact size
                 text_image.set_pixel_size(300)  # Set pixel size (like icon)
@@ -93,11 +105,13 @@ class SplashWindow(Gtk.Window):
         tagline.set_max_width_chars(50)
         main_box.append(tagline)
         
-        # Loading spinner
-        spinner = Gtk.Spinner()
-        spinner.set_spinning(True)
-        spinner.set_size_request(32, 32)
-        main_box.append(spinner)
+        # Loading spinner (it keeps redrawing even with animations disabled)
+        settings = Gtk.Settings.get_default()
+        if settings is None or settings.props.gtk_enable_animations:
+            spinner = Gtk.Spinner()
+            spinner.set_spinning(True)
+            spinner.set_size_request(32, 32)
+            main_box.append(spinner)
         
         loading_label = Gtk.Label(label="Loading...")
         loading_label.add_css_class("caption")
@@ -105,18 +119,26 @@ class SplashWindow(Gtk.Window):
         main_box.append(loading_label)
         
         # Add dark mode styling
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(b"""
+        css = b"""
             window.splash {
                 background: #1e1e1e;
                 color: #ffffff;
-                border-radius: 12px;
-                box-shadow: 0 8px 16px rgba(0, 0, 0, 0.5);
             }
             window.splash label {
                 color: #ffffff;
             }
-        """)
+        """
+        # Rounded corners and shadows force offscreen rendering and blur
+        # passes, which are slow on the software renderer
+        if os.environ.get("GSK_RENDERER", "") in _GPU_RENDERERS:
+            css += b"""
+            window.splash {
+                border-radius: 12px;
+                box-shadow: 0 8px 16px rgba(0, 0, 0, 0.5);
+            }
+            """
+        css_provider = Gtk.CssProvider()
+        css_provider.load_from_data(css)
         
         Gtk.StyleContext.add_provider_for_display(
             self.get_display(),
@@ -129,35 +151,29 @@ class SplashWindow(Gtk.Window):
     
     def _find_icon(self) -> Optional[Path]:
         """Find the application icon"""
-        # Try multiple locations
-        possible_paths = [
-            Path(__file__).parent.parent / "data" / "icons" / "com.luxusb.LUXusb.png",
-            Path.cwd() / "luxusb" / "data" / "icons" / "com.luxusb.LUXusb.png",
-        ]
-        
-        for path in possible_paths:
-            if path.exists():
-                logger.info(f"Found icon at: {path}")
-                return path
-        
-        logger.warning("Could not find application icon for splash screen")
-        return None
+        if _ICON_PATH:
+            logger.info(f"Found icon at: {_ICON_PATH}")
+        else:
+            logger.warning("Could not find application icon for splash screen")
+        return _ICON_PATH
     
     def _find_text_logo(self) -> Optional[Path]:
         """Find the text logo (from archived sources if needed)"""
-        possible_paths = [
-            Path(__file__).parent.parent.parent / "archive" / "images-source" / "luxusb-text-source.png",
-        ]
-        
-        for path in possible_paths:
-            if path.exists():
-                logger.info(f"Found text logo at: {path}")
-                return path
-        
-        logger.debug("Could not find text logo for splash screen")
-        return None
+        if _TEXT_LOGO_PATH:
+            logger.info(f"Found text logo at: {_TEXT_LOGO_PATH}")
+        else:
+            logger.debug("Could not find text logo for splash screen")
+        return _TEXT_LOGO_PATH
     
     def close_splash(self) -> None:
-        """Close the splash screen with a fade effect"""
+        """Hide the splash screen now and tear it down on the next idle"""
+        self.set_visible(False)
+        GLib.idle_add(self._destroy_splash)
+    
+    def _destroy_splash(self) -> bool:
+        """Release the splash widgets and textures (GTK main thread)"""
+        self.set_child(None)
         self.close()
+        self.destroy()
+        return False  # Don't repeat
 
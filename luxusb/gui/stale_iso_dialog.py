@@ -3,11 +3,18 @@ Stale ISO notification dialog
 """
 
 import logging
-from typing import Callable, List, Optional
-from threading import Thread
+import os
+import shutil
+from concurrent.futures import Future, as_completed
+from typing import Any, Callable, Dict, List, Optional
 
-from luxusb.gui import Gtk, Adw, GLib
+from luxusb.gui import Gtk, Adw, GLib, submit_workflow
+from luxusb.gui._progress_dialog import BaseProgressDialog
 
+from luxusb.config import Config
+from luxusb.constants import Size
+from luxusb.utils._daemon_pool import DaemonThreadPool
+from luxusb.utils.downloader import ISODownloader
 from luxusb.utils.grub_refresher import OutdatedISO
 
 logger = logging.getLogger(__name__)
@@ -25,18 +32,16 @@ class StaleISODialog(Adw.MessageDialog):
         self.set_heading("ℹ️ Outdated ISOs Detected")
         
         # Build message
-        message = "The following ISOs have newer versions available:\n\n"
-        
-        for iso_info in outdated_isos[:5]:  # Show first 5
-            message += f"• {iso_info.upgrade_description}\n"
+        parts = ["The following ISOs have newer versions available:\n\n"]
+        parts.extend(f"• {iso_info.upgrade_description}\n" for iso_info in outdated_isos[:5])  # Show first 5
         
         if len(outdated_isos) > 5:
             remaining = len(outdated_isos) - 5
-            message += f"\n...and {remaining} more"
+            parts.append(f"\n...and {remaining} more")
         
-        message += f"\n\n📦 {len(outdated_isos)} update(s) available"
+        parts.append(f"\n\n📦 {len(outdated_isos)} update(s) available")
         
-        self.set_body(message)
+        self.set_body("".join(parts))
         
         # Add responses
         self.add_response("keep", "Keep Current")
@@ -53,116 +58,25 @@ class StaleISODialog(Adw.MessageDialog):
         self.outdated_isos = outdated_isos
 
 
-class ISOUpdateProgressDialog(Gtk.Window):
+class ISOUpdateProgressDialog(BaseProgressDialog):
     """Dialog showing ISO update progress"""
     
+    SUCCESS_STATUS = "All ISOs updated successfully!"
+    
     def __init__(self, parent: Gtk.Window, outdated_isos: List[OutdatedISO]) -> None:
-        super().__init__()
-        self.set_transient_for(parent)
-        self.set_modal(True)
-        self.set_title("Updating ISOs")
-        self.set_default_size(550, 350)
-        self.set_resizable(False)
-        
-        # Main container
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        box.set_margin_top(24)
-        box.set_margin_bottom(24)
-        box.set_margin_start(24)
-        box.set_margin_end(24)
-        
-        # Title
-        title = Gtk.Label()
-        title.set_markup("<big><b>Updating Distribution ISOs</b></big>")
-        box.append(title)
-        
-        # Progress bar
-        self.progress_bar = Gtk.ProgressBar()
-        self.progress_bar.set_show_text(True)
-        self.progress_bar.set_text("Starting...")
-        box.append(self.progress_bar)
-        
-        # Status label
-        self.status_label = Gtk.Label()
-        self.status_label.set_wrap(True)
-        self.status_label.set_max_width_chars(60)
-        self.status_label.set_xalign(0.0)
-        box.append(self.status_label)
-        
-        # Scrolled window for log messages
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_vexpand(True)
-        scrolled.set_min_content_height(180)
-        
-        self.log_view = Gtk.TextView()
-        self.log_view.set_editable(False)
-        self.log_view.set_wrap_mode(Gtk.WrapMode.WORD)
-        self.log_view.set_monospace(True)
-        self.log_buffer = self.log_view.get_buffer()
-        scrolled.set_child(self.log_view)
-        box.append(scrolled)
-        
-        # Close button (initially disabled)
-        button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-        button_box.set_halign(Gtk.Align.END)
-        
-        self.close_button = Gtk.Button(label="Close")
-        self.close_button.set_sensitive(False)
-        self.close_button.connect("clicked", lambda _: self.close())
-        button_box.append(self.close_button)
-        
-        box.append(button_box)
-        
-        self.set_child(box)
+        super().__init__(
+            parent,
+            title="Updating ISOs",
+            heading="Updating Distribution ISOs",
+            default_size=(550, 350),
+            items=outdated_isos,
+            status_width_chars=60,
+            log_min_height=180
+        )
         
         # Store ISO list
         self.outdated_isos = outdated_isos
         self.total_isos = len(outdated_isos)
-        self.success_count = 0
-        self.error_count = 0
-    
-    def update_progress(self, fraction: float, text: str) -> None:
-        """Update progress bar"""
-        self.progress_bar.set_fraction(fraction)
-        self.progress_bar.set_text(text)
-    
-    def update_status(self, status: str) -> None:
-        """Update status label"""
-        self.status_label.set_text(status)
-    
-    def append_log(self, message: str, style: str = "normal") -> None:
-        """Append message to log view"""
-        end_iter = self.log_buffer.get_end_iter()
-        
-        # Style markers
-        if style == "success":
-            message = f"✅ {message}"
-        elif style == "error":
-            message = f"❌ {message}"
-        elif style == "info":
-            message = f"ℹ️  {message}"
-        elif style == "progress":
-            message = f"🔄 {message}"
-        
-        self.log_buffer.insert(end_iter, f"{message}\n")
-        
-        # Auto-scroll to bottom
-        end_mark = self.log_buffer.create_mark(None, end_iter, False)
-        self.log_view.scroll_to_mark(end_mark, 0.0, True, 0.0, 1.0)
-    
-    def mark_complete(self) -> None:
-        """Mark update process as complete"""
-        if self.error_count == 0:
-            self.progress_bar.set_fraction(1.0)
-            self.progress_bar.set_text(f"✅ Complete ({self.success_count} updated)")
-            self.update_status("All ISOs updated successfully!")
-        else:
-            self.progress_bar.set_fraction(1.0)
-            self.progress_bar.set_text(f"⚠️ Complete with errors")
-            self.update_status(f"{self.success_count} updated, {self.error_count} failed")
-        
-        # Enable close button
-        self.close_button.set_sensitive(True)
 
 
 class ISOUpdateWorkflow:
@@ -180,6 +94,7 @@ class ISOUpdateWorkflow:
         self.data_mount = data_mount
         self.on_complete = on_complete
         self.dialog: Optional[ISOUpdateProgressDialog] = None
+        self._future: Optional[Future] = None
     
     def start(self) -> None:
         """Start ISO update workflow"""
@@ -187,106 +102,138 @@ class ISOUpdateWorkflow:
         self.dialog = ISOUpdateProgressDialog(self.parent, self.outdated_isos)
         self.dialog.present()
         
-        # Start background thread
-        thread = Thread(target=self._run_updates, daemon=True)
-        thread.start()
+        # Run on the shared (daemon) workflow pool
+        self._future = submit_workflow(self._run_updates)
     
     def _run_updates(self) -> None:
         """Run ISO updates in background thread"""
-        from luxusb.utils.downloader import ISODownloader
-        from luxusb.config import Config
-        import shutil
-        
         config = Config()
         total = len(self.outdated_isos)
+        inv_total = 1.0 / total if total else 0.0
+        self._progress_labels = tuple(f"{i}/{total} ISOs" for i in range(total + 1))
+        max_workers = config.get('download.max_parallel_downloads', 4) or 4
+        keep_backup = config.get('download.keep_backup', False)
         
-        for index, iso_info in enumerate(self.outdated_isos, 1):
+        # {filename: release} per distro, built once on first encounter so each
+        # release's URL is split at most once per run
+        release_index: Dict[int, Dict[str, Any]] = {}
+        
+        def download_one(iso_info: OutdatedISO, matching_release: Any) -> bool:
+            """Download and swap in one ISO (runs on a pool thread)"""
             distro = iso_info.distro
             available = iso_info.available_version
             current_path = iso_info.current_path
             
-            # Update progress
-            fraction = (index - 1) / total
-            GLib.idle_add(
-                self.dialog.update_progress,
-                fraction,
-                f"{index}/{total} ISOs"
-            )
-            GLib.idle_add(
-                self.dialog.update_status,
-                f"Downloading {distro.name} {available.version}..."
-            )
-            GLib.idle_add(
-                self.dialog.append_log,
+            self.dialog.append_log(
                 f"Updating {distro.name}...",
                 "progress"
             )
             
+            temp_path = None
             try:
-                # Find matching release
-                matching_release = None
-                for release in distro.releases:
-                    if release.iso_url:
-                        filename = release.iso_url.split('/')[-1]
-                        parsed = self.dialog.outdated_isos[0].available_version.__class__.__name__
-                        # Simplified: just check if version is in filename
-                        if available.version in filename:
-                            matching_release = release
-                            break
-                
                 if not matching_release:
                     raise Exception(f"Could not find release for version {available.version}")
                 
-                # Download new ISO
-                downloader = ISODownloader(config)
+                # Download new ISO (one downloader, and HTTP session, per job)
+                downloader = ISODownloader()
                 temp_path = current_path.parent / f"{available.filename}.tmp"
                 
-                GLib.idle_add(
-                    self.dialog.append_log,
+                self.dialog.append_log(
                     f"Downloading from: {matching_release.iso_url[:50]}...",
                     "info"
                 )
                 
-                # Simple download (no progress callback for now)
+                # Simple download (no progress callback for now); the SHA256
+                # is computed while writing, so the ISO is only traversed once
                 success = downloader.download(
                     matching_release.iso_url,
                     temp_path,
-                    matching_release.sha256
+                    matching_release.sha256,
+                    chunk_size=Size.DOWNLOAD_CHUNK
                 )
                 
                 if not success:
                     raise Exception("Download failed")
                 
-                # Backup old ISO
-                backup_path = current_path.parent / f"{current_path.name}.backup"
-                shutil.move(str(current_path), str(backup_path))
-                
-                # Move new ISO to place
                 final_path = current_path.parent / available.filename
-                shutil.move(str(temp_path), str(final_path))
+                backup_path = None
+                if keep_backup:
+                    backup_path = current_path.parent / f"{current_path.name}.backup"
+                    shutil.move(str(current_path), str(backup_path))
+                
+                # Atomic rename over the old ISO (single directory-entry update);
+                # put the backup back if it fails, so the ISO isn't lost
+                try:
+                    os.replace(temp_path, final_path)
+                except OSError:
+                    if backup_path is not None:
+                        shutil.move(str(backup_path), str(current_path))
+                    raise
+                if not keep_backup and final_path != current_path:
+                    current_path.unlink(missing_ok=True)
                 
                 # Success!
-                self.dialog.success_count += 1
-                GLib.idle_add(
-                    self.dialog.append_log,
+                self.dialog.append_log(
                     f"{distro.name}: Updated to {available.version}",
                     "success"
                 )
-                
-                # Remove backup
-                backup_path.unlink()
+                return True
                 
             except Exception as e:
-                self.dialog.error_count += 1
                 logger.exception(f"Error updating {distro.name}")
-                GLib.idle_add(
-                    self.dialog.append_log,
+                # Don't leave a partial multi-GB download on the USB
+                if temp_path is not None:
+                    try:
+                        temp_path.unlink(missing_ok=True)
+                    except OSError as cleanup_error:
+                        logger.warning(f"Could not remove {temp_path}: {cleanup_error}")
+                self.dialog.append_log(
                     f"{distro.name}: {str(e)}",
                     "error"
                 )
+                return False
+        
+        self.dialog.post_step(
+            0.0,
+            self._progress_labels[0],
+            f"Downloading {total} ISO(s)..."
+        )
+        
+        releases = [self._find_release(iso_info, release_index) for iso_info in self.outdated_isos]
+        max_workers = self._fit_parallel_downloads(max_workers, releases)
+        
+        # Daemon workers, so quitting mid-download doesn't wait for the ISOs
+        executor = DaemonThreadPool(max_workers, thread_name_prefix="luxusb-iso")
+        try:
+            futures = {
+                executor.submit(download_one, iso_info, release): iso_info
+                for iso_info, release in zip(self.outdated_isos, releases)
+            }
+            
+            # Counters are only touched here, on this thread, in completion order
+            completed = 0
+            for future in as_completed(futures):
+                if future.result():
+                    self.dialog.success_count += 1
+                else:
+                    self.dialog.error_count += 1
+                completed += 1
+                
+                iso_info = futures[future]
+                self.dialog.post_step(
+                    completed * inv_total,
+                    self._progress_labels[completed],
+                    f"Finished {iso_info.distro.name} {iso_info.available_version.version}"
+                )
+        finally:
+            executor.shutdown()
         
         # Mark complete
-        GLib.idle_add(self.dialog.mark_complete)
+        GLib.idle_add(
+            self.dialog.mark_complete,
+            self.dialog.success_count,
+            self.dialog.error_count
+        )
         
         # Call completion callback
         if self.on_complete:
@@ -295,3 +242,57 @@ class ISOUpdateWorkflow:
                 self.dialog.success_count,
                 self.dialog.error_count
             )
+    
+    def _fit_parallel_downloads(self, max_workers: int, releases: List[Any]) -> int:
+        """
+        Cap parallel downloads so their temp files fit on the data partition
+        
+        Every download writes a full .tmp ISO next to the old one on the
+        same USB partition, so N parallel downloads need room for the N
+        largest ISOs at once.
+        """
+        try:
+            free = shutil.disk_usage(self.data_mount).free
+        except OSError as e:
+            logger.warning(f"Could not check free space on {self.data_mount}: {e}")
+            return 1
+        
+        sizes = sorted((r.size_mb * Size.MB for r in releases if r), reverse=True)
+        fit = 0
+        needed = 0
+        for size in sizes[:max_workers]:
+            needed += size
+            if needed > free:
+                break
+            fit += 1
+        
+        if fit < min(max_workers, len(sizes)):
+            logger.info(f"Limiting to {max(fit, 1)} parallel download(s): {free // Size.MB} MB free")
+        return max(fit, 1)
+    
+    @staticmethod
+    def _find_release(
+        iso_info: OutdatedISO,
+        release_index: Dict[int, Dict[str, Any]]
+    ) -> Optional[Any]:
+        """Find the release matching an outdated ISO's available version"""
+        distro = iso_info.distro
+        available = iso_info.available_version
+        
+        releases = release_index.get(id(distro))
+        if releases is None:
+            releases = release_index[id(distro)] = {
+                release.iso_filename: release
+                for release in distro.releases
+                if release.iso_url
+            }
+        
+        # available_version was parsed from a release filename, so an
+        # exact lookup normally hits; fall back to a version substring
+        matching_release = releases.get(available.filename)
+        if matching_release is None:
+            matching_release = next(
+                (r for fn, r in releases.items() if available.version in fn),
+                None
+            )
+        return matching_release
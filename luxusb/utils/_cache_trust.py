@@ -0,0 +1,41 @@
+"""
+Ownership checks for on-disk caches whose contents are trusted
+
+LUXusb can run elevated (pkexec/sudo) while HOME still points at the
+invoking user's directory. A cache another account can write must not
+be read as if it were ours.
+"""
+
+import os
+import stat
+from pathlib import Path
+
+# Group/other write bits that would let another account replace contents
+_FOREIGN_WRITE = stat.S_IWGRP | stat.S_IWOTH
+
+
+def _is_private(path: Path, kind: int) -> bool:
+    """True if path is a kind (not a symlink) owned by us and not writable by others"""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_IFMT(st.st_mode) == kind
+        and st.st_uid == os.geteuid()
+        and not st.st_mode & _FOREIGN_WRITE
+    )
+
+
+def ensure_private_dir(directory: Path) -> bool:
+    """Create directory (mode 0700) if needed; True if it is safe to keep trusted files in"""
+    try:
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    except OSError:
+        return False
+    return _is_private(directory, stat.S_IFDIR)
+
+
+def is_private_file(path: Path) -> bool:
+    """True if path and its directory are owned by us and not writable by others"""
+    return _is_private(path.parent, stat.S_IFDIR) and _is_private(path, stat.S_IFREG)
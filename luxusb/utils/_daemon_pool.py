@@ -0,0 +1,101 @@
+"""
+Small reusable worker pool whose threads don't hold the process open
+"""
+
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, List
+
+
+class DaemonThreadPool:
+    """
+    Queue-fed pool of daemon worker threads
+    
+    Unlike ThreadPoolExecutor, whose workers are joined at interpreter
+    exit, these workers are daemon threads: quitting the app while a
+    long download is running exits instead of waiting for it. Workers
+    are started lazily (up to max_workers) and reused across submits.
+    """
+    
+    def __init__(self, max_workers: int, thread_name_prefix: str = "luxusb-worker") -> None:
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self._jobs: queue.SimpleQueue = queue.SimpleQueue()
+        self._threads: List[threading.Thread] = []
+        self._idle = 0
+        self._lock = threading.Lock()
+        self._shutdown = False
+    
+    def submit(self, fn: Callable, *args: Any) -> Future:
+        """Schedule fn(*args) on a worker and return its Future"""
+        future: Future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot submit after shutdown")
+            self._jobs.put((future, fn, args))
+            # Only add a worker when none is waiting for this job
+            if self._idle == 0 and len(self._threads) < self.max_workers:
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"{self.thread_name_prefix}-{len(self._threads)}",
+                    daemon=True
+                )
+                self._threads.append(thread)
+                thread.start()
+            elif self._idle:
+                self._idle -= 1
+        return future
+    
+    def shutdown(self, cancel_futures: bool = False) -> None:
+        """
+        Stop accepting work and let idle workers exit
+        
+        Never waits: running jobs finish on their own daemon threads.
+        
+        Args:
+            cancel_futures: Cancel jobs that haven't started yet
+        """
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            if cancel_futures:
+                while True:
+                    try:
+                        future, _fn, _args = self._jobs.get_nowait()
+                    except queue.Empty:
+                        break
+                    future.cancel()
+            # One sentinel per worker wakes it up to exit
+            for _ in self._threads:
+                self._jobs.put(None)
+    
+    def _work(self) -> None:
+        """Worker loop: run queued jobs until a shutdown sentinel arrives"""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            future, fn, args = job
+            if not future.set_running_or_notify_cancel():
+                self._mark_idle()
+                continue
+            try:
+                result = fn(*args)
+            except BaseException as exc:
+                # Count as idle before waking the caller, so a submit made
+                # right after result() reuses this worker
+                self._mark_idle()
+                future.set_exception(exc)
+            else:
+                self._mark_idle()
+                future.set_result(result)
+            del job, future, fn, args
+    
+    def _mark_idle(self) -> None:
+        """Record that a worker is about to wait for the next job"""
+        with self._lock:
+            self._idle += 1
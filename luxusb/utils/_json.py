@@ -0,0 +1,21 @@
+"""
+JSON parsing with orjson when it is installed, stdlib json otherwise
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up
+    orjson = None
+
+# orjson also parses buffers (memoryview), so callers can skip the bytes copy
+HAS_ORJSON = orjson is not None
+
+if orjson is not None:
+    # Accepts bytes or str; orjson.JSONDecodeError subclasses json.JSONDecodeError
+    loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+else:
+    loads = json.loads
+    JSONDecodeError = json.JSONDecodeError
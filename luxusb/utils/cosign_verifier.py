@@ -1,16 +1,89 @@
 """Cosign signature verification for container-based ISOs"""
 
+import base64
+import functools
+import os
 import subprocess
 import logging
+import hashlib
 import json
-import tempfile
 import re
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Dict, Tuple, List
+from typing import Optional, Dict, Iterator, Tuple, List
 from dataclasses import dataclass
 
+from luxusb.constants import PathPattern
+from luxusb.utils._cache_trust import ensure_private_dir, is_private_file
+from luxusb.utils._json import loads as _json_loads
+
 logger = logging.getLogger(__name__)
 
+# Resolved once per process; exec'ing the absolute path skips the PATH search
+_COSIGN_BIN = shutil.which('cosign')
+# First installed of podman/docker, used for registry manifest lookups
+_CONTAINER_TOOL = next(filter(None, map(shutil.which, ('podman', 'docker'))), None)
+
+# Environment variable cosign reads the public key from (--key env://...)
+_KEY_ENV_VAR = "LUXUSB_COSIGN_PUBLIC_KEY"
+
+# 64-hex-digit SHA256 digests in signature annotations
+_SHA256_RE = re.compile(r'([0-9a-f]{64})', re.IGNORECASE)
+_HEXCHARS = frozenset('0123456789abcdefABCDEF')
+
+# Signature reference printed by 'cosign triangulate' (repo:sha256-<hex>.sig)
+_SIG_REF_RE = re.compile(r':sha256-([0-9a-f]{64})\.sig$')
+
+# Helper threads for overlapping independent network lookups
+_IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="luxusb-cosign")
+
+
+@functools.lru_cache(maxsize=32)
+def key_fingerprint(key_content: str) -> str:
+    """
+    SHA256 hex digest of a PEM public key's DER body
+    
+    The DER is just the base64 between the BEGIN/END lines, so no crypto
+    library is needed, and PEM formatting differences (line wrapping,
+    trailing newlines) map to the same fingerprint.
+    """
+    body = ''.join(
+        line.strip() for line in key_content.splitlines()
+        if line.strip() and not line.startswith('-----')
+    )
+    try:
+        der = base64.b64decode(body, validate=True)
+    except ValueError:
+        der = key_content.strip().encode()
+    return hashlib.sha256(der).hexdigest()
+
+
+@functools.cache
+def _get_session():
+    """Shared HTTP session for key fetches (created on first use)"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    session.headers.update({'User-Agent': 'LUXusb/0.2.0'})
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["HEAD", "GET"]
+    )
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retry_strategy)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 
 @dataclass
 class CosignKey:
@@ -20,6 +93,10 @@ class CosignKey:
     key_content: Optional[str] = None  # Cached key content
     container_registry: str = ""  # e.g., ghcr.io/ublue-os/bazzite
     note: Optional[str] = None
+    
+    def fingerprint(self) -> Optional[str]:
+        """SHA256 of the key's DER encoding (None until key_content is known)"""
+        return key_fingerprint(self.key_content) if self.key_content else None
 
 
 @dataclass
@@ -34,68 +111,123 @@ class CosignVerification:
 class CosignVerifier:
     """Verify cosign signatures for container-based distribution images"""
     
+    # Maximum number of successful verifications remembered per process
+    VERIFY_CACHE_SIZE = 128
+    # How long a successful verification is trusted across runs (seconds)
+    RESULT_CACHE_TTL = 7 * 24 * 60 * 60
+    
     def __init__(self):
+        # (image, digest, key sha256) -> (distro_id, result), oldest first
+        self._verify_cache: OrderedDict[Tuple[str, str, str], Tuple[str, CosignVerification]] = OrderedDict()
+        self._verify_lock = threading.Lock()
+        # Downloaded public keys: on disk across runs, in memory for this run
+        self.key_cache_dir = Path.home() / PathPattern.COSIGN_KEY_CACHE_DIR
+        self._key_cache: Dict[str, str] = {}
+        # Successful verifications persisted across runs (opened on first use)
+        self.results_db_path = Path.home() / PathPattern.COSIGN_RESULT_DB
+        self._results_db: Optional[sqlite3.Connection] = None
+        self._results_lock = threading.Lock()
+        # Key content -> cosign child environment (see _cosign_env)
+        self._key_envs: Dict[str, Dict[str, str]] = {}
         self.keys_file = Path(__file__).parent.parent / "data" / "cosign_keys.json"
-        self.cosign_available = self._check_cosign_available()
-        self.keys_data = self._load_keys()
+        self._cosign_bin = _COSIGN_BIN
+        # CosignKey objects built from _keys_raw on demand (see get_key)
+        self.keys_data: Dict[str, CosignKey] = {}
+    
+    @functools.cached_property
+    def cosign_available(self) -> bool:
+        """Whether cosign is installed (checked on first use)"""
+        return self._check_cosign_available()
+    
+    @functools.cached_property
+    def _keys_raw(self) -> Dict[str, dict]:
+        """Raw entries from cosign_keys.json (read on first use)"""
+        return self._load_keys()
     
     def _check_cosign_available(self) -> bool:
         """Check if cosign is available on the system"""
-        try:
-            result = subprocess.run(
-                ['cosign', 'version'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                logger.info(f"Cosign is available: {result.stdout.strip()}")
-                return True
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+        if self._cosign_bin:
+            logger.info(f"Cosign is available: {self._cosign_bin}")
+            return True
         
         logger.warning("Cosign not available - signature verification disabled")
         logger.warning("Install cosign: https://docs.sigstore.dev/cosign/installation/")
         return False
     
-    def _load_keys(self) -> Dict[str, CosignKey]:
-        """Load cosign keys from JSON file"""
+    def _load_keys(self) -> Dict[str, dict]:
+        """Load raw cosign key entries from JSON file"""
         if not self.keys_file.exists():
             logger.warning(f"Cosign keys file not found: {self.keys_file}")
             return {}
         
         try:
-            with open(self.keys_file, 'r') as f:
-                data = json.load(f)
-            
-            keys = {}
-            for distro_id, key_info in data.items():
-                keys[distro_id] = CosignKey(
-                    description=key_info.get('description', ''),
-                    key_url=key_info.get('key_url', ''),
-                    key_content=key_info.get('key_content'),
-                    container_registry=key_info.get('container_registry', ''),
-                    note=key_info.get('note')
-                )
+            raw = self.keys_file.read_bytes()
+            data = _json_loads(raw)
             
-            logger.info(f"Loaded {len(keys)} cosign keys")
-            return keys
+            logger.info(f"Loaded {len(data)} cosign keys")
+            return data
             
         except Exception as e:
             logger.error(f"Failed to load cosign keys: {e}")
             return {}
     
     def get_key(self, distro_id: str) -> Optional[CosignKey]:
-        """Get cosign key for a distribution"""
-        return self.keys_data.get(distro_id)
+        """Get cosign key for a distribution (built on first use)"""
+        key = self.keys_data.get(distro_id)
+        if key is not None:
+            return key
+        
+        key_info = self._keys_raw.get(distro_id)
+        if key_info is None:
+            return None
+        
+        key = CosignKey(
+            description=key_info.get('description', ''),
+            key_url=key_info.get('key_url', ''),
+            key_content=key_info.get('key_content'),
+            container_registry=key_info.get('container_registry', ''),
+            note=key_info.get('note')
+        )
+        self.keys_data[distro_id] = key
+        return key
     
     def download_public_key(self, key_url: str) -> Optional[str]:
-        """Download cosign public key from URL"""
-        import requests
+        """
+        Download cosign public key from URL
+        
+        Keys are kept on disk and revalidated with If-None-Match /
+        If-Modified-Since, so an unchanged key costs a 304 and a cached
+        key is still usable when the network is down. The cached copy is
+        only used if no other account could have written it.
+        """
+        if key_url in self._key_cache:
+            return self._key_cache[key_url]
+        
+        cache_path = self.key_cache_dir / f"{hashlib.sha256(key_url.encode()).hexdigest()}.pub"
+        meta_path = cache_path.with_suffix('.json')
+        
+        cached_key = None
+        headers = {}
+        if is_private_file(cache_path) and is_private_file(meta_path):
+            try:
+                cached_key = cache_path.read_text().strip()
+                meta = json.loads(meta_path.read_text())
+                if meta.get('etag'):
+                    headers['If-None-Match'] = meta['etag']
+                if meta.get('last_modified'):
+                    headers['If-Modified-Since'] = meta['last_modified']
+            except (OSError, ValueError):
+                pass
         
         try:
             logger.info(f"Downloading cosign public key from {key_url}")
-            response = requests.get(key_url, timeout=10)
+            response = _get_session().get(key_url, timeout=10, headers=headers)
+            
+            if response.status_code == 304 and cached_key:
+                logger.info("Cosign public key unchanged, using cached copy")
+                self._key_cache[key_url] = cached_key
+                return cached_key
+            
             response.raise_for_status()
             
             key_content = response.text.strip()
@@ -103,15 +235,39 @@ class CosignVerifier:
             # Validate it looks like a cosign public key
             if '-----BEGIN PUBLIC KEY-----' in key_content:
                 logger.info("Successfully downloaded cosign public key")
+                self._store_cached_key(cache_path, meta_path, key_content, response.headers)
+                self._key_cache[key_url] = key_content
                 return key_content
             else:
                 logger.warning("Downloaded content doesn't look like a cosign public key")
                 return None
                 
         except Exception as e:
+            if cached_key:
+                logger.warning(f"Failed to refresh cosign public key ({e}), using cached copy")
+                self._key_cache[key_url] = cached_key
+                return cached_key
             logger.error(f"Failed to download cosign public key: {e}")
             return None
     
+    def _store_cached_key(self, cache_path: Path, meta_path: Path, key_content: str, headers) -> None:
+        """Atomically write a downloaded key and its validators to the cache"""
+        meta = {
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+        }
+        if not ensure_private_dir(cache_path.parent):
+            logger.debug(f"Not caching cosign public key in shared directory {cache_path.parent}")
+            return
+        
+        try:
+            for path, text in ((cache_path, key_content), (meta_path, json.dumps(meta))):
+                with tempfile.NamedTemporaryFile('w', dir=path.parent, delete=False) as tmp:
+                    tmp.write(text)
+                os.replace(tmp.name, path)
+        except OSError as e:
+            logger.debug(f"Could not cache cosign public key: {e}")
+    
     def verify_container_image(
         self,
         distro_id: str,
@@ -137,92 +293,432 @@ class CosignVerifier:
             )
         
         # Get or download the public key
+        digest_future = None
         if not key_content:
             key_info = self.get_key(distro_id)
-            if not key_info:
+            if key_info and not key_info.key_content and key_info.key_url not in self._key_cache:
+                # The key download and the digest lookup are independent
+                # round trips, so look the digest up while the key downloads
+                digest_future = _IO_POOL.submit(self._resolve_digest, container_image)
+            
+            key_content, error = self._resolve_key_content(distro_id)
+            if error:
                 return CosignVerification(
                     verified=False,
                     signature_info={},
-                    error_message=f"No cosign key configured for {distro_id}"
+                    error_message=error
                 )
+        
+        # Use a digest that is already known (pinned reference or the lookup
+        # overlapped with the key download). Only ask cosign to triangulate
+        # a tag when a cached result could actually be reused
+        key_fp = key_fingerprint(key_content)
+        if digest_future:
+            digest = digest_future.result()
+        else:
+            digest = self._pinned_digest(container_image)
+            if digest is None and self._has_cached_result(container_image, distro_id, key_fp):
+                digest = self._triangulate_digest(container_image)
+        
+        # Verify exactly the resolved digest, so the result is only ever
+        # cached under the digest cosign actually checked
+        reference = self._pin(container_image, digest) if digest else container_image
+        if digest:
+            cache_key = (container_image, digest, key_fp)
+            with self._verify_lock:
+                cached = self._verify_cache.get(cache_key)
+                if cached is not None:
+                    self._verify_cache.move_to_end(cache_key)
+                    logger.info(f"Using cached cosign verification for {container_image}")
+                    return cached[1]
             
-            if key_info.key_content:
-                key_content = key_info.key_content
-            else:
-                key_content = self.download_public_key(key_info.key_url)
-                if not key_content:
-                    return CosignVerification(
+            stored = self._lookup_result(digest, key_fp)
+            if stored is not None:
+                logger.info(f"Using stored cosign verification for {container_image}")
+                return stored
+        
+        verification = self._run_cosign_verify(reference, key_content)
+        
+        # An unpinned tag is cached under the manifest digest cosign reports
+        # having verified, which the next lookup's triangulate will match
+        if verification.verified and not digest:
+            digest = self._manifest_digest(verification.signature_info)
+        if digest and verification.verified:
+            cache_key = (container_image, digest, key_fp)
+            self._store_result(digest, key_fp, distro_id, verification)
+            with self._verify_lock:
+                self._verify_cache[cache_key] = (distro_id, verification)
+                self._verify_cache.move_to_end(cache_key)
+                while len(self._verify_cache) > self.VERIFY_CACHE_SIZE:
+                    self._verify_cache.popitem(last=False)
+        
+        return verification
+    
+    def _resolve_key_content(self, distro_id: str) -> Tuple[Optional[str], Optional[str]]:
+        """Get a distribution's public key as (key_content, error_message)"""
+        key_info = self.get_key(distro_id)
+        if not key_info:
+            return None, f"No cosign key configured for {distro_id}"
+        
+        if key_info.key_content:
+            return key_info.key_content, None
+        
+        key_content = self.download_public_key(key_info.key_url)
+        if not key_content:
+            return None, "Failed to download cosign public key"
+        return key_content, None
+    
+    def verify_batch(
+        self,
+        entries: List[Tuple[str, str, Optional[str]]]
+    ) -> List[CosignVerification]:
+        """
+        Verify many images with one cosign run per distinct public key
+        
+        Distributions that share a signing key (e.g. the ublue-os images)
+        are verified together, so cosign starts once per key rather than
+        once per image. Tags are verified as given, without the digest
+        pinning verify_container_image does, so batched results are never
+        written to the verification caches.
+        
+        Args:
+            entries: (distro_id, container_image, expected_sha256) tuples;
+                expected_sha256 may be None
+        
+        Returns:
+            CosignVerification for each entry, in input order
+        """
+        if not self.cosign_available:
+            return [
+                CosignVerification(
+                    verified=False,
+                    signature_info={},
+                    error_message="Cosign not installed on system"
+                )
+                for _ in entries
+            ]
+        
+        results: List[Optional[CosignVerification]] = [None] * len(entries)
+        
+        # key fingerprint -> (key content, indices of entries signed with it)
+        groups: Dict[str, Tuple[str, List[int]]] = {}
+        for index, (distro_id, _image, _expected) in enumerate(entries):
+            key_content, error = self._resolve_key_content(distro_id)
+            if error:
+                results[index] = CosignVerification(
+                    verified=False,
+                    signature_info={},
+                    error_message=error
+                )
+                continue
+            groups.setdefault(key_fingerprint(key_content), (key_content, []))[1].append(index)
+        
+        for key_content, indices in groups.values():
+            images = [entries[i][1] for i in indices]
+            verifications = self._run_cosign_verify_many(images, key_content)
+            for index, verification in zip(indices, verifications):
+                expected = entries[index][2]
+                if (verification.verified and expected and verification.sha256
+                        and verification.sha256.lower() != expected.lower()):
+                    verification = CosignVerification(
+                        verified=False,
+                        signature_info=verification.signature_info,
+                        error_message="Signed digest does not match expected SHA256",
+                        sha256=verification.sha256
+                    )
+                results[index] = verification
+        
+        return results
+    
+    def _run_cosign_verify_many(self, images: List[str], key_content: str) -> List[CosignVerification]:
+        """Verify several images signed by one key in a single cosign run"""
+        if len(images) == 1:
+            return [self._run_cosign_verify(images[0], key_content)]
+        
+        try:
+            logger.info(f"Verifying {len(images)} container images with one key")
+            result = subprocess.run(
+                [self._cosign_bin, 'verify', '--key', f'env://{_KEY_ENV_VAR}', *images],
+                capture_output=True,
+                timeout=30 * len(images),
+                env=self._cosign_env(key_content)
+            )
+        except (subprocess.TimeoutExpired, OSError) as e:
+            # The per-image path reports a missing or broken binary as a
+            # failed CosignVerification instead of raising
+            logger.debug(f"Batched cosign run failed: {e}")
+            result = None
+        
+        # cosign prints one JSON array per verified image; anything else
+        # (a failure stops it at the first bad image) is retried per image
+        outputs = [line for line in result.stdout.splitlines() if line.startswith(b'[')] if result else []
+        if result is None or result.returncode != 0 or len(outputs) != len(images):
+            logger.info("Batched cosign run inconclusive, verifying images individually")
+            return [self._run_cosign_verify(image, key_content) for image in images]
+        
+        for image in images:
+            logger.info(f"✅ Cosign verification successful: {image}")
+        return [self._verification_from_output(output) for output in outputs]
+    
+    def verify_container_images(
+        self,
+        pairs: List[Tuple[str, str]],
+        max_workers: int = 8
+    ) -> Iterator[Tuple[str, str, CosignVerification]]:
+        """
+        Verify several container images concurrently
+        
+        Args:
+            pairs: (distro_id, container_image) tuples to verify
+            max_workers: Maximum number of verifications in flight
+        
+        Yields:
+            (distro_id, container_image, CosignVerification) in completion order
+        """
+        if not pairs:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as executor:
+            future_to_pair = {
+                executor.submit(self.verify_container_image, distro_id, image): (distro_id, image)
+                for distro_id, image in pairs
+            }
+            
+            for future in as_completed(future_to_pair):
+                distro_id, image = future_to_pair[future]
+                try:
+                    verification = future.result()
+                except Exception as e:
+                    logger.error(f"Cosign verification error for {image}: {e}")
+                    verification = CosignVerification(
                         verified=False,
                         signature_info={},
-                        error_message="Failed to download cosign public key"
+                        error_message=str(e)
                     )
+                yield distro_id, image, verification
+    
+    def _resolve_digest(self, container_image: str) -> Optional[str]:
+        """Get the manifest digest an image reference points at (pinned or via cosign triangulate)"""
+        digest = self._pinned_digest(container_image)
+        return digest if digest else self._triangulate_digest(container_image)
+    
+    @staticmethod
+    def _pinned_digest(container_image: str) -> Optional[str]:
+        """Digest of a repo@sha256:<digest> reference, None for tags"""
+        if '@sha256:' in container_image:
+            return container_image.rsplit('@sha256:', 1)[1]
+        return None
+    
+    @staticmethod
+    def _manifest_digest(signature_info: Dict) -> Optional[str]:
+        """Manifest digest cosign verified, from its critical.image section"""
+        try:
+            digest = signature_info['critical']['image']['docker-manifest-digest']
+        except (KeyError, TypeError):
+            return None
+        if isinstance(digest, str) and digest.startswith('sha256:'):
+            return digest[len('sha256:'):]
+        return None
+    
+    def _has_cached_result(self, container_image: str, distro_id: str, key_fp: str) -> bool:
+        """Whether a verification of this image and key may be cached"""
+        with self._verify_lock:
+            if any(k[0] == container_image and k[2] == key_fp for k in self._verify_cache):
+                return True
+        return bool(self._query_results(
+            "SELECT 1 FROM verifications WHERE distro_id = ? AND key_fp = ? AND verified_at > ? LIMIT 1",
+            (distro_id, key_fp, time.time() - self.RESULT_CACHE_TTL)
+        ))
+    
+    def invalidate(self, distro_id: str) -> None:
+        """Drop cached verification results for a distribution"""
+        with self._verify_lock:
+            stale = [k for k, (d, _) in self._verify_cache.items() if d == distro_id]
+            for k in stale:
+                del self._verify_cache[k]
         
-        # Write key to temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.pub', delete=False) as key_file:
-            key_file.write(key_content)
-            key_path = key_file.name
+        self._query_results("DELETE FROM verifications WHERE distro_id = ?", (distro_id,))
+    
+    def _open_results_db(self) -> Optional[sqlite3.Connection]:
+        """Open (and create) the persistent result cache, None if unusable"""
+        if self._results_db is None:
+            # A row here skips signature verification, so only trust a
+            # database no other account can write
+            db_path = self.results_db_path
+            if not ensure_private_dir(db_path.parent) or (db_path.exists() and not is_private_file(db_path)):
+                logger.warning(f"Ignoring cosign result cache not owned by this user: {db_path}")
+                return None
+            try:
+                conn = sqlite3.connect(str(self.results_db_path), check_same_thread=False)
+                with conn:
+                    # Rows from the first layout lack the signature details
+                    conn.execute("DROP TABLE IF EXISTS verifies")
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS verifications ("
+                        "digest TEXT NOT NULL, key_fp TEXT NOT NULL, distro_id TEXT NOT NULL, "
+                        "verified_at REAL NOT NULL, sha256 TEXT, signature_info TEXT NOT NULL, "
+                        "PRIMARY KEY (digest, key_fp))"
+                    )
+                self._results_db = conn
+            except (OSError, sqlite3.Error) as e:
+                logger.debug(f"Cosign result cache unavailable: {e}")
+                return None
+        return self._results_db
+    
+    def _query_results(self, sql: str, params: Tuple) -> List[Tuple]:
+        """Run one statement against the result cache (empty list on error)"""
+        with self._results_lock:
+            conn = self._open_results_db()
+            if conn is None:
+                return []
+            try:
+                with conn:
+                    return conn.execute(sql, params).fetchall()
+            except sqlite3.Error as e:
+                logger.debug(f"Cosign result cache query failed: {e}")
+                return []
+    
+    def _lookup_result(self, digest: str, key_fp: str) -> Optional[CosignVerification]:
+        """Stored verification of digest with this key, if newer than RESULT_CACHE_TTL"""
+        rows = self._query_results(
+            "SELECT sha256, signature_info FROM verifications "
+            "WHERE digest = ? AND key_fp = ? AND verified_at > ?",
+            (digest, key_fp, time.time() - self.RESULT_CACHE_TTL)
+        )
+        if not rows:
+            return None
         
+        sha256, signature_info = rows[0]
+        try:
+            return CosignVerification(
+                verified=True,
+                signature_info=_json_loads(signature_info),
+                sha256=sha256
+            )
+        except ValueError:
+            return None
+    
+    def _store_result(
+        self,
+        digest: str,
+        key_fp: str,
+        distro_id: str,
+        verification: CosignVerification
+    ) -> None:
+        """Remember a successful verification of digest for later runs"""
+        try:
+            signature_info = json.dumps(verification.signature_info)
+        except (TypeError, ValueError):
+            return
+        
+        self._query_results(
+            "INSERT OR REPLACE INTO verifications "
+            "(digest, key_fp, distro_id, verified_at, sha256, signature_info) VALUES (?, ?, ?, ?, ?, ?)",
+            (digest, key_fp, distro_id, time.time(), verification.sha256, signature_info)
+        )
+    
+    def _triangulate_digest(self, container_image: str) -> Optional[str]:
+        """
+        Ask cosign which manifest digest a tag currently points at
+        
+        Not cached: a tag can move at any time, and the digest returned
+        here is the one that gets verified and cached.
+        """
         try:
-            # Run cosign verify
-            logger.info(f"Verifying container image: {container_image}")
             result = subprocess.run(
-                ['cosign', 'verify', '--key', key_path, container_image],
+                [self._cosign_bin, 'triangulate', container_image],
                 capture_output=True,
                 text=True,
-                timeout=30
+                timeout=15
+            )
+        except (subprocess.TimeoutExpired, OSError) as e:
+            logger.debug(f"cosign triangulate failed for {container_image}: {e}")
+            return None
+        
+        match = _SIG_REF_RE.search(result.stdout.strip()) if result.returncode == 0 else None
+        return match.group(1) if match else None
+    
+    @staticmethod
+    def _pin(container_image: str, digest: str) -> str:
+        """Turn a tag reference into repo@sha256:<digest> (digest references are kept)"""
+        if '@' in container_image:
+            return container_image
+        
+        # Strip the tag (a ':' after the last '/'; earlier ones are registry ports)
+        name, sep, tag = container_image.rpartition(':')
+        repo = name if sep and '/' not in tag else container_image
+        return f"{repo}@sha256:{digest}"
+    
+    def _cosign_env(self, key_content: str) -> Dict[str, str]:
+        """Child environment carrying a public key, built once per distinct key"""
+        env = self._key_envs.get(key_content)
+        if env is None:
+            env = {**os.environ, _KEY_ENV_VAR: key_content}
+            self._key_envs[key_content] = env
+        return env
+    
+    def _run_cosign_verify(self, container_image: str, key_content: str) -> CosignVerification:
+        """Run cosign verify for one image and parse its output"""
+        try:
+            # Run cosign verify, handing the key over in the environment
+            # (cosign's env:// key reference) instead of a temporary file
+            logger.info(f"Verifying container image: {container_image}")
+            result = subprocess.run(
+                [self._cosign_bin, 'verify', '--key', f'env://{_KEY_ENV_VAR}', container_image],
+                capture_output=True,
+                timeout=30,
+                env=self._cosign_env(key_content)
             )
             
             if result.returncode == 0:
-                logger.info("✅ Cosign verification successful")
+                logger.info(f"✅ Cosign verification successful: {container_image}")
                 
-                # Parse the JSON output
-                try:
-                    signature_info = json.loads(result.stdout)
-                    if isinstance(signature_info, list) and len(signature_info) > 0:
-                        signature_info = signature_info[0]
-                    
-                    # Try to extract SHA256 from the signature
-                    sha256 = self._extract_sha256_from_signature(signature_info)
-                    
-                    return CosignVerification(
-                        verified=True,
-                        signature_info=signature_info,
-                        sha256=sha256
-                    )
-                except json.JSONDecodeError:
-                    # Verification succeeded but couldn't parse output
-                    return CosignVerification(
-                        verified=True,
-                        signature_info={'raw_output': result.stdout}
-                    )
+                return self._verification_from_output(result.stdout)
             else:
-                logger.error(f"❌ Cosign verification failed: {result.stderr}")
+                stderr = result.stderr.decode(errors='replace')
+                logger.error(f"❌ Cosign verification failed for {container_image}: {stderr}")
                 return CosignVerification(
                     verified=False,
                     signature_info={},
-                    error_message=result.stderr
+                    error_message=stderr
                 )
                 
         except subprocess.TimeoutExpired:
-            logger.error("Cosign verification timed out")
+            logger.error(f"Cosign verification timed out: {container_image}")
             return CosignVerification(
                 verified=False,
                 signature_info={},
                 error_message="Verification timed out after 30 seconds"
             )
         except Exception as e:
-            logger.error(f"Cosign verification error: {e}")
+            logger.error(f"Cosign verification error for {container_image}: {e}")
             return CosignVerification(
                 verified=False,
                 signature_info={},
                 error_message=str(e)
             )
-        finally:
-            # Clean up temporary key file
-            try:
-                Path(key_path).unlink()
-            except:
-                pass
+    
+    def _verification_from_output(self, output: bytes) -> CosignVerification:
+        """Build a successful CosignVerification from cosign's raw JSON output"""
+        try:
+            signature_info = _json_loads(output)
+            if isinstance(signature_info, list) and len(signature_info) > 0:
+                signature_info = signature_info[0]
+            
+            # Try to extract SHA256 from the signature
+            sha256 = self._extract_sha256_from_signature(signature_info)
+            
+            return CosignVerification(
+                verified=True,
+                signature_info=signature_info,
+                sha256=sha256
+            )
+        except json.JSONDecodeError:
+            # Verification succeeded but couldn't parse output
+            return CosignVerification(
+                verified=True,
+                signature_info={'raw_output': output.decode(errors='replace')}
+            )
     
     def _extract_sha256_from_signature(self, signature_info: Dict) -> Optional[str]:
         """Try to extract SHA256 digest from signature metadata"""
@@ -246,10 +742,14 @@ class CosignVerifier:
                 optional = signature_info['optional']
                 for key, value in optional.items():
                     if 'sha256' in key.lower() or 'digest' in key.lower():
-                        # Try to extract hex string
-                        match = re.search(r'([0-9a-f]{64})', str(value), re.IGNORECASE)
-                        if match:
-                            sha256 = match.group(1).lower()
+                        # Try to extract hex string (bare digests skip the regex)
+                        value = str(value)
+                        if len(value) == 64 and _HEXCHARS.issuperset(value):
+                            sha256 = value.lower()
+                        else:
+                            match = _SHA256_RE.search(value)
+                            sha256 = match.group(1).lower() if match else None
+                        if sha256:
                             logger.info(f"Extracted SHA256 from optional field: {sha256[:16]}...")
                             return sha256
             
@@ -309,32 +809,29 @@ class CosignVerifier:
         Returns:
             SHA256 digest or None if unavailable
         """
+        if not _CONTAINER_TOOL:
+            logger.warning("Could not retrieve container digest (docker/podman not available)")
+            return None
+        
         try:
-            # Use docker/podman to get the digest
-            for tool in ['docker', 'podman']:
-                try:
-                    result = subprocess.run(
-                        [tool, 'manifest', 'inspect', container_image],
-                        capture_output=True,
-                        text=True,
-                        timeout=15
-                    )
-                    
-                    if result.returncode == 0:
-                        manifest = json.loads(result.stdout)
-                        
-                        # Extract digest from manifest
-                        if 'config' in manifest and 'digest' in manifest['config']:
-                            digest = manifest['config']['digest']
-                            if digest.startswith('sha256:'):
-                                sha256 = digest.replace('sha256:', '')
-                                logger.info(f"Got container digest: {sha256[:16]}...")
-                                return sha256
-                        
-                except (subprocess.TimeoutExpired, FileNotFoundError):
-                    continue
+            result = subprocess.run(
+                [_CONTAINER_TOOL, 'manifest', 'inspect', container_image],
+                capture_output=True,
+                timeout=15
+            )
             
-            logger.warning("Could not retrieve container digest (docker/podman not available)")
+            if result.returncode == 0:
+                manifest = _json_loads(result.stdout)
+                
+                # Extract digest from manifest
+                if 'config' in manifest and 'digest' in manifest['config']:
+                    digest = manifest['config']['digest']
+                    if digest.startswith('sha256:'):
+                        sha256 = digest.replace('sha256:', '')
+                        logger.info(f"Got container digest: {sha256[:16]}...")
+                        return sha256
+            
+            logger.warning(f"Could not retrieve container digest for {container_image}")
             return None
             
         except Exception as e:
@@ -343,7 +840,7 @@ class CosignVerifier:
     
     def is_distro_cosign_signed(self, distro_id: str) -> bool:
         """Check if a distribution uses cosign signatures"""
-        return distro_id in self.keys_data
+        return distro_id in self.keys_data or distro_id in self._keys_raw
     
     def install_instructions(self) -> str:
         """Return instructions for installing cosign"""
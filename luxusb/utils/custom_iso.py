@@ -3,6 +3,9 @@ Custom ISO validation and management
 """
 
 import logging
+import mmap
+import shutil
+import stat
 import subprocess
 from pathlib import Path
 from typing import Optional, Tuple
@@ -10,6 +13,23 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# ISO 9660 primary volume descriptor signature (sector 16, byte 1)
+ISO9660_MAGIC = b'CD001'
+ISO9660_MAGIC_OFFSET = 0x8001
+
+# MBR boot signature found on hybrid ISO images
+MBR_SIGNATURE = b'\x55\xAA'
+MBR_SIGNATURE_OFFSET = 0x1FE
+
+# Volume descriptor set starts at sector 16; El Torito is a type 0 boot record
+ISO_SECTOR_SIZE = 2048
+ISO_DESCRIPTOR_OFFSET = 0x8000
+ISO_MAX_DESCRIPTORS = 16
+EL_TORITO_ID = b'EL TORITO SPECIFICATION'
+
+# Resolved once per process instead of forking to discover a missing tool
+_ISOINFO_BIN = shutil.which('isoinfo')
+
 
 @dataclass
 class CustomISO:
@@ -73,60 +93,32 @@ class CustomISOValidator:
         Returns:
             CustomISO object with validation results
         """
-        # Check if file exists
-        if not iso_path.exists():
-            return CustomISO(
-                path=iso_path,
-                name=name or iso_path.stem,
-                size_bytes=0,
-                is_valid=False,
-                error_message="File does not exist"
-            )
-        
-        # Check if it's a file (not directory)
-        if not iso_path.is_file():
-            return CustomISO(
-                path=iso_path,
-                name=name or iso_path.stem,
-                size_bytes=0,
-                is_valid=False,
-                error_message="Path is not a file"
-            )
-        
-        # Get file size
-        size_bytes = iso_path.stat().st_size
-        
-        # Check size constraints
-        if size_bytes < self.MIN_ISO_SIZE:
-            return CustomISO(
-                path=iso_path,
-                name=name or iso_path.stem,
-                size_bytes=size_bytes,
-                is_valid=False,
-                error_message=f"File too small (minimum {self.MIN_ISO_SIZE // (1024*1024)} MB)"
-            )
-        
-        if size_bytes > self.MAX_ISO_SIZE:
-            return CustomISO(
-                path=iso_path,
-                name=name or iso_path.stem,
-                size_bytes=size_bytes,
-                is_valid=False,
-                error_message=f"File too large (maximum {self.MAX_ISO_SIZE // (1024*1024*1024)} GB)"
-            )
+        # One stat(2) answers the existence, type and size checks
+        try:
+            st = iso_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            st = None
         
-        # Check file extension
-        if iso_path.suffix.lower() not in ['.iso', '.img']:
-            return CustomISO(
-                path=iso_path,
-                name=name or iso_path.stem,
-                size_bytes=size_bytes,
-                is_valid=False,
-                error_message="Invalid file extension (must be .iso or .img)"
-            )
+        size_bytes = st.st_size if st is not None and stat.S_ISREG(st.st_mode) else 0
+        is_valid = False
         
-        # Validate ISO format
-        is_valid, error = self._validate_iso_format(iso_path)
+        if st is None:
+            error = "File does not exist"
+        elif not stat.S_ISREG(st.st_mode):
+            error = "Path is not a file"
+        elif size_bytes < self.MIN_ISO_SIZE:
+            error = f"File too small (minimum {self.MIN_ISO_SIZE // (1024*1024)} MB)"
+        elif size_bytes > self.MAX_ISO_SIZE:
+            error = f"File too large (maximum {self.MAX_ISO_SIZE // (1024*1024*1024)} GB)"
+        elif iso_path.suffix.lower() not in ('.iso', '.img'):
+            error = "Invalid file extension (must be .iso or .img)"
+        elif self._read_iso_magic(iso_path):
+            # A matching header is conclusive, only ambiguous files
+            # (e.g. raw .img without a signature) need file(1)
+            self.logger.debug(f"Valid ISO format detected from header: {iso_path.name}")
+            is_valid, error = True, None
+        else:
+            is_valid, error = self._validate_iso_format(iso_path)
         
         return CustomISO(
             path=iso_path,
@@ -136,10 +128,62 @@ class CustomISOValidator:
             error_message=error
         )
     
+    def _read_iso_magic(self, iso_path: Path) -> bool:
+        """
+        Check the ISO 9660 / hybrid MBR signatures by reading the header
+        
+        Args:
+            iso_path: Path to ISO file
+        
+        Returns:
+            True if either signature is present
+        """
+        try:
+            with iso_path.open('rb') as f:
+                header = f.read(ISO9660_MAGIC_OFFSET + len(ISO9660_MAGIC))
+        except OSError as e:
+            self.logger.debug(f"Could not read ISO header: {e}")
+            return False
+        
+        if header[ISO9660_MAGIC_OFFSET:ISO9660_MAGIC_OFFSET + len(ISO9660_MAGIC)] == ISO9660_MAGIC:
+            return True
+        # Hybrid images (isohybrid) carry an MBR boot signature
+        return header[MBR_SIGNATURE_OFFSET:MBR_SIGNATURE_OFFSET + 2] == MBR_SIGNATURE
+    
+    def _read_boot_record(self, iso_path: Path) -> Optional[bool]:
+        """
+        Look for an El Torito boot record in the ISO 9660 volume descriptors
+        
+        Args:
+            iso_path: Path to ISO file
+        
+        Returns:
+            True/False for ISO 9660 images, None if the file could not be
+            mapped or has no volume descriptors (caller falls back to isoinfo)
+        """
+        try:
+            with iso_path.open('rb') as f, mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ) as mm:
+                for index in range(ISO_MAX_DESCRIPTORS):
+                    offset = ISO_DESCRIPTOR_OFFSET + index * ISO_SECTOR_SIZE
+                    descriptor = mm[offset:offset + 7 + len(EL_TORITO_ID)]
+                    if descriptor[1:6] != ISO9660_MAGIC:
+                        # Not ISO 9660 at all, or a malformed descriptor set
+                        return None if index == 0 else False
+                    if descriptor[0] == 0x00:
+                        return descriptor[7:] == EL_TORITO_ID
+                    if descriptor[0] == 0xFF:
+                        # Set terminator reached without a boot record
+                        return False
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"Could not map ISO for boot record check: {e}")
+        return None
+    
     def _validate_iso_format(self, iso_path: Path) -> Tuple[bool, Optional[str]]:
         """
         Validate ISO 9660 format using file command
         
+        Used when the header check in _read_iso_magic() is inconclusive.
+        
         Args:
             iso_path: Path to ISO file
         
@@ -191,10 +235,18 @@ class CustomISOValidator:
         Returns:
             True if bootable, False otherwise
         """
+        has_boot_record = self._read_boot_record(iso_path)
+        if has_boot_record is not None:
+            return has_boot_record
+        
+        if not _ISOINFO_BIN:
+            self.logger.warning("isoinfo not available, assuming bootable")
+            return True
+        
         try:
             # Use isoinfo to check for bootable flag
             result = subprocess.run(
-                ['isoinfo', '-d', '-i', str(iso_path)],
+                [_ISOINFO_BIN, '-d', '-i', str(iso_path)],
                 capture_output=True,
                 text=True,
                 timeout=10
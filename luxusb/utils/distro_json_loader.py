@@ -2,20 +2,50 @@
 JSON-based distribution metadata loader
 """
 
+import hashlib
 import json
 import logging
+import mmap
+import os
+import re
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict
-from dataclasses import dataclass
+from typing import List, Optional, Dict, Union
+from dataclasses import asdict, dataclass
 
+from luxusb.constants import PathPattern
+from luxusb.utils import _json
+from luxusb.utils._cache_trust import ensure_private_dir, is_private_file
 from luxusb.utils.distro_manager import Distro, DistroRelease
 
 logger = logging.getLogger(__name__)
 
+# Package data locations, computed once at import
+_PKG_DIR = Path(__file__).resolve().parent.parent
+_DEFAULT_DATA_DIR = _PKG_DIR / "data" / "distros"
+_DEFAULT_SCHEMA_PATH = _PKG_DIR / "data" / "distro-schema.json"
+
+# A SHA256 checksum: exactly 64 hex digits
+_SHA256_RE = re.compile(r'\A[0-9a-fA-F]{64}\Z')
+
+
+def _intern(value):
+    """Intern string values; pass None and other non-str values through"""
+    return sys.intern(value) if isinstance(value, str) else value
+
 
 class DistroJSONLoader:
     """Load distribution metadata from JSON files"""
     
+    # Bump when Distro/DistroRelease fields or parse rules change (invalidates the disk cache)
+    CACHE_VERSION = 4
+    # Upper bound on threads reading distro files in load_all
+    MAX_LOAD_WORKERS = 8
+    # Files above this size are memory-mapped instead of read (orjson only)
+    MMAP_THRESHOLD = 64 * 1024
+    
     def __init__(self, data_dir: Optional[Path] = None):
         """
         Initialize loader
@@ -25,13 +55,18 @@ class DistroJSONLoader:
         """
         if data_dir is None:
             # Default to package data directory
-            package_dir = Path(__file__).parent.parent
-            self.data_dir = package_dir / "data" / "distros"
+            self.data_dir = _DEFAULT_DATA_DIR
+            self.schema_path = _DEFAULT_SCHEMA_PATH
         else:
             self.data_dir = Path(data_dir)
-        
-        self.schema_path = self.data_dir.parent / "distro-schema.json"
+            self.schema_path = self.data_dir.parent / "distro-schema.json"
         self._cache: Dict[str, Distro] = {}
+        # True once load_all has filled _cache with every distro
+        self._loaded_all = False
+        # jsonschema validator built from schema_path on first validate_schema()
+        self._validator = None
+        # Parsed distros saved as plain JSON across runs, keyed by the files' mtimes/sizes
+        self.cache_path = Path.home() / PathPattern.CACHE_DIR / PathPattern.DISTRO_CACHE_FILE
     
     def load_all(self) -> List[Distro]:
         """
@@ -46,26 +81,90 @@ class DistroJSONLoader:
             logger.warning(f"Distro data directory not found: {self.data_dir}")
             return distros
         
-        # Find all JSON files
-        json_files = list(self.data_dir.glob("*.json"))
+        # Find all JSON files (plain scandir; no Path objects or glob matching)
+        with os.scandir(self.data_dir) as entries:
+            json_entries = sorted(
+                (entry for entry in entries
+                 if entry.name.endswith('.json') and entry.is_file(follow_symlinks=False)),
+                key=lambda entry: entry.name
+            )
+        json_files = [entry.path for entry in json_entries]
         logger.info(f"Found {len(json_files)} distro JSON files")
         
-        for json_file in json_files:
+        cache_key = self._cache_key(json_entries)
+        cached = self._read_cache(cache_key)
+        if cached is not None:
+            logger.info(f"Loaded {len(cached)} distributions from cache")
+            self._remember_all(cached)
+            return cached
+        
+        def load_one(json_file: str) -> Optional[Distro]:
             try:
-                distro = self.load_distro(json_file)
-                if distro:
-                    distros.append(distro)
+                return self.load_distro(json_file)
             except Exception as e:
-                logger.error(f"Failed to load {json_file.name}: {e}")
-                continue
+                logger.error(f"Failed to load {os.path.basename(json_file)}: {e}")
+                return None
+        
+        # Overlap file reads; load_distro doesn't touch shared state
+        if json_files:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_LOAD_WORKERS, len(json_files))) as executor:
+                distros.extend(d for d in executor.map(load_one, json_files) if d)
         
         # Sort by popularity rank
         distros.sort(key=lambda d: d.popularity_rank)
         
         logger.info(f"Loaded {len(distros)} distributions")
+        self._write_cache(cache_key, distros)
+        self._remember_all(distros)
         return distros
     
-    def load_distro(self, file_path: Path) -> Optional[Distro]:
+    def _remember_all(self, distros: List[Distro]) -> None:
+        """Fill the by-id cache from a complete load_all result"""
+        for distro in distros:
+            self._cache[distro.id] = distro
+        self._loaded_all = True
+    
+    def _cache_key(self, json_entries: List[os.DirEntry]) -> str:
+        """Fingerprint the data directory from file names, mtimes and sizes"""
+        stats = [(entry.name, entry.stat().st_mtime_ns, entry.stat().st_size) for entry in json_entries]
+        fingerprint = repr((self.CACHE_VERSION, str(self.data_dir), stats))
+        return hashlib.blake2b(fingerprint.encode(), digest_size=16).hexdigest()
+    
+    def _read_cache(self, cache_key: str) -> Optional[List[Distro]]:
+        """Return cached distros if the cache matches cache_key"""
+        # Another account could otherwise replace the catalog we act on as root
+        if not is_private_file(self.cache_path):
+            return None
+        
+        try:
+            with open(self.cache_path, 'rb') as f:
+                cached = _json.loads(f.read())
+            if cached.get('key') != cache_key:
+                return None
+            return [
+                Distro(**{**entry, 'releases': [DistroRelease(**rel) for rel in entry['releases']]})
+                for entry in cached['distros']
+            ]
+        except Exception as e:
+            # Corrupt or written by an incompatible version; rebuilt below
+            logger.debug(f"Ignoring unreadable distro cache: {e}")
+            return None
+    
+    def _write_cache(self, cache_key: str, distros: List[Distro]) -> None:
+        """Atomically write distros to the cache file"""
+        if not ensure_private_dir(self.cache_path.parent):
+            logger.debug(f"Not caching distros in shared directory {self.cache_path.parent}")
+            return
+        
+        try:
+            payload = {'key': cache_key, 'distros': [asdict(distro) for distro in distros]}
+            with tempfile.NamedTemporaryFile('w', dir=self.cache_path.parent, delete=False) as tmp:
+                json.dump(payload, tmp)
+            os.replace(tmp.name, self.cache_path)
+        except Exception as e:
+            logger.debug(f"Could not write distro cache: {e}")
+    
+    def load_distro(self, file_path: Union[str, os.PathLike]) -> Optional[Distro]:
         """
         Load a single distribution from JSON file
         
@@ -75,30 +174,30 @@ class DistroJSONLoader:
         Returns:
             Distro object or None if loading fails
         """
+        file_name = os.path.basename(file_path)
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._read_json(file_path)
             
             # Validate required fields
             required = ['id', 'name', 'description', 'homepage', 'category', 
                        'popularity_rank', 'releases']
             for field in required:
                 if field not in data:
-                    logger.error(f"Missing required field '{field}' in {file_path.name}")
+                    logger.error(f"Missing required field '{field}' in {file_name}")
                     return None
             
-            # Parse releases
-            releases = []
+            # Validate every release first, then build the valid ones
+            valid = []
             for rel_data in data['releases']:
-                try:
-                    release = self._parse_release(rel_data)
-                    releases.append(release)
-                except Exception as e:
-                    logger.error(f"Failed to parse release in {file_path.name}: {e}")
-                    continue
+                error = self._validate_release(rel_data)
+                if error:
+                    logger.error(f"Failed to parse release in {file_name}: {error}")
+                else:
+                    valid.append(rel_data)
+            releases = [self._build_release(rel_data) for rel_data in valid]
             
             if not releases:
-                logger.warning(f"No valid releases found in {file_path.name}")
+                logger.warning(f"No valid releases found in {file_name}")
                 return None
             
             # Create Distro object
@@ -108,24 +207,32 @@ class DistroJSONLoader:
                 description=data['description'],
                 homepage=data['homepage'],
                 logo_url=data.get('logo_url', ''),
-                category=data['category'],
+                category=_intern(data['category']),
                 popularity_rank=data['popularity_rank'],
                 releases=releases,
-                family=data.get('family'),  # Optional family field
-                base_distro=data.get('base_distro'),  # Optional base_distro field
+                family=_intern(data.get('family')),  # Optional family field
+                base_distro=_intern(data.get('base_distro')),  # Optional base_distro field
                 secure_boot_compatible=data.get('secure_boot_compatible', False)  # Secure Boot compatibility
             )
             
             logger.debug(f"Loaded distro: {distro.name} ({len(releases)} releases)")
             return distro
             
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in {file_path.name}: {e}")
+        except _json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON in {file_name}: {e}")
             return None
         except Exception as e:
-            logger.error(f"Failed to load {file_path.name}: {e}")
+            logger.error(f"Failed to load {file_name}: {e}")
             return None
     
+    def _read_json(self, file_path: Union[str, os.PathLike]):
+        """Parse a JSON file, mapping large files instead of copying them"""
+        with open(file_path, 'rb') as f:
+            if _json.HAS_ORJSON and os.fstat(f.fileno()).st_size > self.MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    return _json.loads(view)
+            return _json.loads(f.read())
+    
     def _parse_release(self, data: dict) -> DistroRelease:
         """
         Parse a release from JSON data
@@ -139,20 +246,50 @@ class DistroJSONLoader:
         Raises:
             ValueError: If required fields are missing
         """
+        error = self._validate_release(data)
+        if error:
+            raise ValueError(error)
+        return self._build_release(data)
+    
+    def _validate_release(self, data: dict) -> Optional[str]:
+        """
+        Check release JSON data without building anything
+        
+        Args:
+            data: Release JSON data
+            
+        Returns:
+            Error message, or None if the release is valid
+        """
+        if not isinstance(data, dict):
+            return "Release entry is not an object"
+        
         required = ['version', 'release_date', 'iso_url', 'sha256', 'size_mb']
         for field in required:
             if field not in data:
-                raise ValueError(f"Missing required field: {field}")
+                return f"Missing required field: {field}"
         
         # Validate SHA256 format (allow special placeholder for manual verification)
         sha256 = data['sha256']
         if not isinstance(sha256, str):
-            raise ValueError(f"Invalid SHA256 checksum: {sha256}")
+            return f"Invalid SHA256 checksum: {sha256}"
         
         # Allow either 64-char hex or special manual verification placeholder
-        if sha256 != "REQUIRES_MANUAL_VERIFICATION" and len(sha256) != 64:
-            raise ValueError(f"Invalid SHA256 checksum: {sha256}")
+        if sha256 != "REQUIRES_MANUAL_VERIFICATION" and not _SHA256_RE.match(sha256):
+            return f"Invalid SHA256 checksum: {sha256}"
         
+        return None
+    
+    def _build_release(self, data: dict) -> DistroRelease:
+        """
+        Build a DistroRelease from data that passed _validate_release
+        
+        Args:
+            data: Release JSON data
+            
+        Returns:
+            DistroRelease object
+        """
         # Parse mirrors (optional)
         mirrors = data.get('mirrors', [])
         if not isinstance(mirrors, list):
@@ -162,9 +299,9 @@ class DistroJSONLoader:
             version=data['version'],
             release_date=data['release_date'],
             iso_url=data['iso_url'],
-            sha256=sha256,
+            sha256=data['sha256'],
             size_mb=data['size_mb'],
-            architecture=data.get('architecture', 'x86_64'),
+            architecture=_intern(data.get('architecture', 'x86_64')),
             mirrors=mirrors
         )
     
@@ -181,6 +318,9 @@ class DistroJSONLoader:
         # Check cache first
         if distro_id in self._cache:
             return self._cache[distro_id]
+        if self._loaded_all:
+            # load_all saw every file, so there is nothing left to probe
+            return None
         
         # Load from file
         json_file = self.data_dir / f"{distro_id}.json"
@@ -194,7 +334,7 @@ class DistroJSONLoader:
         
         return distro
     
-    def validate_schema(self, file_path: Path) -> bool:
+    def validate_schema(self, file_path: Union[str, os.PathLike]) -> bool:
         """
         Validate a distro JSON file against the schema
         
@@ -213,25 +353,29 @@ class DistroJSONLoader:
             logger.warning("jsonschema package not available, skipping validation")
             return True
         
+        file_name = os.path.basename(file_path)
         try:
-            # Load schema
-            with open(self.schema_path, 'r', encoding='utf-8') as f:
-                schema = json.load(f)
+            # Build the validator once; the schema is only checked and parsed here
+            if self._validator is None:
+                with open(self.schema_path, 'rb') as f:
+                    schema = _json.loads(f.read())
+                validator_cls = jsonschema.validators.validator_for(schema)
+                validator_cls.check_schema(schema)
+                self._validator = validator_cls(schema)
             
             # Load distro data
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._read_json(file_path)
             
             # Validate
-            jsonschema.validate(data, schema)
-            logger.debug(f"Schema validation passed: {file_path.name}")
+            self._validator.validate(data)
+            logger.debug(f"Schema validation passed: {file_name}")
             return True
             
         except jsonschema.ValidationError as e:
-            logger.error(f"Schema validation failed for {file_path.name}: {e.message}")
+            logger.error(f"Schema validation failed for {file_name}: {e.message}")
             return False
         except Exception as e:
-            logger.error(f"Validation error for {file_path.name}: {e}")
+            logger.error(f"Validation error for {file_name}: {e}")
             return False
 
 
@@ -3,13 +3,14 @@ Linux distribution metadata and management
 """
 
 import logging
+import threading
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class DistroRelease:
     """Represents a specific release of a Linux distribution"""
     version: str
@@ -29,9 +30,14 @@ class DistroRelease:
     def size_gb(self) -> float:
         """Get size in gigabytes"""
         return self.size_mb / 1024.0
+    
+    @property
+    def iso_filename(self) -> str:
+        """Get the ISO file name (last path segment of iso_url)"""
+        return self.iso_url.rsplit('/', 1)[-1]
 
 
-@dataclass
+@dataclass(slots=True)
 class Distro:
     """Represents a Linux distribution"""
     id: str
@@ -53,7 +59,7 @@ class Distro:
         return self.releases[0] if self.releases else None
 
 
-@dataclass
+@dataclass(slots=True)
 class DistroSelection:
     """Represents a user-selected distribution for installation"""
     distro: Distro
@@ -144,60 +150,85 @@ class DistroManager:
         """
         Initialize distro manager
         
-        Loads distributions from JSON files in luxusb/data/distros/
+        Distributions are loaded from JSON files in luxusb/data/distros/
+        on first access, not here
         """
-        self.distros: List[Distro] = []
-        self._load_distros()
+        from luxusb.utils.distro_json_loader import get_distro_loader
+        
+        self._loader = get_distro_loader()
+        self._distros: Optional[List[Distro]] = None
+        self._load_lock = threading.Lock()
+        # Lookup structures rebuilt whenever distros are loaded
+        self._by_id: Dict[str, Distro] = {}
+        self._search_index: List[Tuple[str, str, Distro]] = []
+        self._by_popularity: List[Distro] = []
+    
+    @property
+    def distros(self) -> List[Distro]:
+        """All distributions, loaded on first access"""
+        self._ensure_loaded()
+        return self._distros
+    
+    def _ensure_loaded(self) -> None:
+        """Load all distributions once (thread-safe)"""
+        if self._distros is None:
+            with self._load_lock:
+                if self._distros is None:
+                    self._load_distros()
     
     def _load_distros(self) -> None:
         """Load distribution metadata from JSON files"""
-        from luxusb.utils.distro_json_loader import load_all_distros
-        
-        self.distros = load_all_distros()
+        distros = self._loader.load_all()
         
-        if not self.distros:
+        if not distros:
             raise RuntimeError("No distributions found. Please ensure JSON files exist in luxusb/data/distros/")
         
-        logger.info("Loaded %d distributions from JSON", len(self.distros))
+        self._by_id = {d.id: d for d in distros}
+        # load_all already sorts, so this is a linear pass that guards the order
+        self._by_popularity = sorted(distros, key=lambda d: d.popularity_rank)
+        # Lower-cased once here instead of on every search
+        self._search_index = [(d.name.lower(), d.description.lower(), d) for d in distros]
+        self._distros = distros
+        
+        logger.info("Loaded %d distributions from JSON", len(distros))
     
     def get_all_distros(self) -> List[Distro]:
         """Get all available distributions"""
         return self.distros
     
     def get_distro_by_id(self, distro_id: str) -> Optional[Distro]:
-        """Get distribution by ID"""
-        for distro in self.distros:
-            if distro.id == distro_id:
-                return distro
-        return None
+        """Get distribution by ID (reads only that distro's file if nothing is loaded yet)"""
+        if self._distros is None:
+            return self._loader.get_distro_by_id(distro_id)
+        return self._by_id.get(distro_id)
     
     def get_popular_distros(self, limit: int = 10) -> List[Distro]:
         """Get most popular distributions"""
-        sorted_distros = sorted(self.distros, key=lambda d: d.popularity_rank)
-        return sorted_distros[:limit]
+        self._ensure_loaded()
+        return self._by_popularity[:limit]
     
     def search_distros(self, query: str) -> List[Distro]:
         """Search distributions by name or description"""
         query = query.lower()
-        results = []
-
-        for distro in self.distros:
-            if (query in distro.name.lower() or
-                    query in distro.description.lower()):
-                results.append(distro)
-        
-        return results
+        self._ensure_loaded()
+        return [
+            distro for name, description, distro in self._search_index
+            if query in name or query in description
+        ]
 
 
 # Global instance (lazy initialization to avoid circular import)
 _distro_manager_instance: Optional['DistroManager'] = None
+_distro_manager_lock = threading.Lock()
 
 
 def get_distro_manager() -> 'DistroManager':
-    """Get or create the global DistroManager singleton"""
+    """Get or create the global DistroManager singleton (thread-safe)"""
     global _distro_manager_instance
     if _distro_manager_instance is None:
-        _distro_manager_instance = DistroManager()
+        with _distro_manager_lock:
+            if _distro_manager_instance is None:
+                _distro_manager_instance = DistroManager()
     return _distro_manager_instance
 
 
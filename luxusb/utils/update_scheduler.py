@@ -4,7 +4,7 @@ Update scheduler for managing metadata update timing and preferences
 
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, Tuple, List
+from typing import Any, Dict, Optional, Set, Tuple, List
 from pathlib import Path
 import json
 
@@ -28,11 +28,52 @@ class UpdateScheduler:
         self.config_dir.mkdir(parents=True, exist_ok=True)
         
         self.prefs_file = self.config_dir / "update_preferences.json"
+        self._prefs_stamp: Optional[Tuple[int, int]] = None
         self.preferences = self._load_preferences()
+        
+        # Skip list entries keyed by their "<distro_id>-<version>" string for
+        # O(1) lookups (not split, since IDs and versions may contain hyphens)
+        self._skip_index: Dict[str, Any] = {}
+        self._rebuild_skip_index()
+    
+    def _get_prefs_stamp(self) -> Optional[Tuple[int, int]]:
+        """Get (mtime, size) of the preferences file (None if missing)"""
+        try:
+            st = self.prefs_file.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def reload_if_changed(self) -> bool:
+        """
+        Reload preferences if the file changed since it was last read/written
+        
+        Long-lived scheduler instances call this so edits made by another
+        instance (e.g. the preferences dialog) are not overwritten.
+        
+        Returns:
+            True if preferences were reloaded
+        """
+        if self._get_prefs_stamp() == self._prefs_stamp:
+            return False
+        self.preferences = self._load_preferences()
+        self._rebuild_skip_index()
+        return True
+    
+    def _rebuild_skip_index(self) -> None:
+        """Re-index the skip list after preferences were loaded or edited"""
+        index = {}
+        for entry in self.preferences.get("skip_versions", []):
+            if isinstance(entry, dict):
+                index[self._skip_key(*self.parse_skip_entry(entry))] = entry
+            else:
+                index[str(entry)] = entry
+        self._skip_index = index
     
     def _load_preferences(self) -> dict:
         """Load update preferences from disk"""
-        if not self.prefs_file.exists():
+        self._prefs_stamp = self._get_prefs_stamp()
+        if self._prefs_stamp is None:
             return self._default_preferences()
         
         try:
@@ -49,12 +90,15 @@ class UpdateScheduler:
         try:
             with open(self.prefs_file, 'w') as f:
                 json.dump(self.preferences, f, indent=2)
+            self._prefs_stamp = self._get_prefs_stamp()
             logger.debug("Saved update preferences")
         except Exception as e:
             logger.error(f"Failed to save preferences: {e}")
     
     def save_preferences(self) -> None:
         """Public method to save preferences (used by GUI)"""
+        # The GUI may have edited the preferences dict directly
+        self._rebuild_skip_index()
         self._save_preferences()
     
     def _default_preferences(self) -> dict:
@@ -179,14 +223,33 @@ class UpdateScheduler:
             distro_id: Distribution ID (e.g., 'ubuntu')
             version: Version to skip (e.g., '25.04')
         """
-        skip_versions = self.preferences.get("skip_versions", [])
-        skip_key = f"{distro_id}-{version}"
+        skip_key = self._skip_key(distro_id, version)
+        if skip_key in self._skip_index:
+            return
         
-        if skip_key not in skip_versions:
-            skip_versions.append(skip_key)
-            self.preferences["skip_versions"] = skip_versions
-            self._save_preferences()
-            logger.info(f"Added {skip_key} to skip list")
+        self._skip_index[skip_key] = skip_key
+        self.preferences["skip_versions"] = list(self._skip_index.values())
+        self._save_preferences()
+        logger.info(f"Added {skip_key} to skip list")
+    
+    def remove_skip_version(self, distro_id: str, version: str) -> bool:
+        """
+        Remove a specific version from the skip list
+        
+        Args:
+            distro_id: Distribution ID
+            version: Version to remove
+            
+        Returns:
+            True if the version was in the skip list
+        """
+        if self._skip_index.pop(self._skip_key(distro_id, version), None) is None:
+            return False
+        
+        self.preferences["skip_versions"] = list(self._skip_index.values())
+        self._save_preferences()
+        logger.info(f"Removed {distro_id}-{version} from skip list")
+        return True
     
     def should_skip_version(self, distro_id: str, version: str) -> bool:
         """
@@ -199,13 +262,47 @@ class UpdateScheduler:
         Returns:
             True if version should be skipped
         """
-        skip_versions = self.preferences.get("skip_versions", [])
-        skip_key = f"{distro_id}-{version}"
-        return skip_key in skip_versions
+        return self._skip_key(distro_id, version) in self._skip_index
+    
+    def get_skipped_versions(self) -> Set[Tuple[str, str]]:
+        """
+        Get all skipped versions in one pass
+        
+        Use this instead of calling should_skip_version() per distribution.
+        
+        Returns:
+            Set of (distro_id, version) tuples
+        """
+        return {self.parse_skip_entry(entry) for entry in self._skip_index.values()}
+    
+    @staticmethod
+    def _skip_key(distro_id: str, version: str) -> str:
+        """Build the stored skip list string for a distro version"""
+        return f"{distro_id}-{version}"
+    
+    @staticmethod
+    def parse_skip_entry(entry) -> Tuple[str, str]:
+        """
+        Split a stored skip list entry into (distro_id, version)
+        
+        String entries are ambiguous when both parts contain hyphens, so
+        this is for display only; lookups match the stored string.
+        
+        Args:
+            entry: "<distro_id>-<version>" string or {distro_id, version} dict
+            
+        Returns:
+            (distro_id, version) tuple
+        """
+        if isinstance(entry, dict):
+            return (entry.get("distro_id", ""), entry.get("version", ""))
+        distro_id, _, version = str(entry).rpartition("-")
+        return (distro_id, version)
     
     def clear_skip_versions(self) -> None:
         """Clear all skipped versions"""
         self.preferences["skip_versions"] = []
+        self._skip_index.clear()
         self._save_preferences()
         logger.info("Cleared skip versions list")
     
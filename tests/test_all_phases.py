@@ -37,6 +37,18 @@ class TestPhase1MetadataUpdates:
             print("✓ Phase 1 dialogs importable")
         except ImportError as e:
             pytest.fail(f"Phase 1 dialog import failed: {e}")
+    
+    def test_skip_response_closes_dialog_once(self):
+        """Skipping the update notification closes the dialog exactly once"""
+        from luxusb.gui.main_window import LUXusbApplication
+        
+        app = Mock()
+        dialog = Mock()
+        LUXusbApplication._handle_update_response(app, dialog, "skip", ["ubuntu"])
+        
+        assert dialog.close.call_count == 1
+        app._scheduler.set_skip_date.assert_called_once_with(days=30)
+        app._scheduler.add_skip_version.assert_called_once_with("ubuntu", "latest")
 
 
 class TestPhase2StaleISODetection:
@@ -0,0 +1,437 @@
+"""
+Tests for cosign signature verification
+"""
+
+import hashlib
+import json
+import subprocess
+import pytest
+from unittest.mock import Mock, patch
+from luxusb.utils.cosign_verifier import CosignKey, CosignVerifier, CosignVerification, key_fingerprint
+
+
+PINNED_IMAGE = "ghcr.io/ublue-os/bazzite@sha256:" + "a" * 64
+
+
+@pytest.fixture
+def verifier(tmp_path):
+    """Create a verifier that believes cosign is installed"""
+    verifier = CosignVerifier()
+    verifier.cosign_available = True
+    verifier.results_db_path = tmp_path / "cosign_results.db"
+    return verifier
+
+
+class TestVerificationCache:
+    """Test in-process caching of verification results"""
+    
+    def test_repeat_verify_uses_cache(self, verifier):
+        """Test a pinned image is only verified once per key"""
+        result = CosignVerification(verified=True, signature_info={})
+        with patch.object(verifier, '_run_cosign_verify', return_value=result) as run:
+            first = verifier.verify_container_image('bazzite', PINNED_IMAGE, key_content='KEY')
+            second = verifier.verify_container_image('bazzite', PINNED_IMAGE, key_content='KEY')
+        
+        assert first is second
+        assert run.call_count == 1
+    
+    def test_failed_verify_not_cached(self, verifier):
+        """Test failures are retried on the next call"""
+        result = CosignVerification(verified=False, signature_info={}, error_message="bad")
+        with patch.object(verifier, '_run_cosign_verify', return_value=result) as run:
+            verifier.verify_container_image('bazzite', PINNED_IMAGE, key_content='KEY')
+            verifier.verify_container_image('bazzite', PINNED_IMAGE, key_content='KEY')
+        
+        assert run.call_count == 2
+    
+    def test_invalidate_drops_distro_entries(self, verifier):
+        """Test invalidate() forces re-verification for that distro"""
+        result = CosignVerification(verified=True, signature_info={})
+        with patch.object(verifier, '_run_cosign_verify', return_value=result) as run:
+            verifier.verify_container_image('bazzite', PINNED_IMAGE, key_content='KEY')
+            verifier.invalidate('bazzite')
+            verifier.verify_container_image('bazzite', PINNED_IMAGE, key_content='KEY')
+        
+        assert run.call_count == 2
+    
+    def test_result_persists_across_instances(self, verifier):
+        """Test a new verifier reuses a stored verification within the TTL"""
+        signature_info = {'critical': {'image': {'docker-manifest-digest': 'sha256:' + "b" * 64}}}
+        result = CosignVerification(verified=True, signature_info=signature_info, sha256="b" * 64)
+        with patch.object(verifier, '_run_cosign_verify', return_value=result):
+            verifier.verify_container_image('bazzite', PINNED_IMAGE, key_content='KEY')
+        
+        other = CosignVerifier()
+        other.cosign_available = True
+        other.results_db_path = verifier.results_db_path
+        with patch.object(other, '_run_cosign_verify') as run:
+            stored = other.verify_container_image('bazzite', PINNED_IMAGE, key_content='KEY')
+        
+        # The stored result matches what a fresh verification reported
+        run.assert_not_called()
+        assert stored.verified is True
+        assert stored.signature_info == signature_info
+        assert stored.sha256 == "b" * 64
+    
+    def test_expired_result_reverified(self, verifier):
+        """Test stored verifications older than the TTL are ignored"""
+        result = CosignVerification(verified=True, signature_info={})
+        with patch.object(verifier, '_run_cosign_verify', return_value=result):
+            verifier.verify_container_image('bazzite', PINNED_IMAGE, key_content='KEY')
+        
+        other = CosignVerifier()
+        other.cosign_available = True
+        other.results_db_path = verifier.results_db_path
+        other.RESULT_CACHE_TTL = 0
+        with patch.object(other, '_run_cosign_verify', return_value=result) as run:
+            other.verify_container_image('bazzite', PINNED_IMAGE, key_content='KEY')
+        
+        assert run.call_count == 1
+    
+    def test_unresolved_tag_not_cached(self, verifier):
+        """Test tags are re-verified when no digest can be resolved"""
+        result = CosignVerification(verified=True, signature_info={})
+        with patch.object(verifier, '_run_cosign_verify', return_value=result) as run, \
+             patch.object(verifier, '_triangulate_digest', return_value=None):
+            verifier.verify_container_image('bazzite', 'ghcr.io/ublue-os/bazzite:stable', key_content='KEY')
+            verifier.verify_container_image('bazzite', 'ghcr.io/ublue-os/bazzite:stable', key_content='KEY')
+        
+        assert run.call_count == 2
+
+
+class TestBatchVerification:
+    """Test concurrent verification of several images"""
+    
+    def test_batch_returns_every_pair(self, verifier):
+        """Test each (distro, image) pair yields one result"""
+        pairs = [('bazzite', 'ghcr.io/a:1'), ('aurora', 'ghcr.io/b:1'), ('bluefin', 'ghcr.io/c:1')]
+        
+        def fake_verify(distro_id, image):
+            return CosignVerification(verified=distro_id != 'aurora', signature_info={})
+        
+        with patch.object(verifier, 'verify_container_image', side_effect=fake_verify):
+            results = {d: (img, v.verified) for d, img, v in verifier.verify_container_images(pairs)}
+        
+        assert results == {
+            'bazzite': ('ghcr.io/a:1', True),
+            'aurora': ('ghcr.io/b:1', False),
+            'bluefin': ('ghcr.io/c:1', True),
+        }
+    
+    def test_batch_turns_exceptions_into_failures(self, verifier):
+        """Test a crashing verification is reported, not raised"""
+        with patch.object(verifier, 'verify_container_image', side_effect=RuntimeError("boom")):
+            results = list(verifier.verify_container_images([('bazzite', 'ghcr.io/a:1')]))
+        
+        assert len(results) == 1
+        assert results[0][2].verified is False
+        assert results[0][2].error_message == "boom"
+
+
+class TestKeyFingerprint:
+    """Test public key fingerprints"""
+    
+    PEM = (
+        "-----BEGIN PUBLIC KEY-----\n"
+        "MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEY6Ya7W++7aUPzvMTrezH6Ycx3c+X\n"
+        "OKYCoQGY6k7C3a8hlBGTbdrFY5xzA6C2EkvWZmDQtvVJb8wSqQVQVPyJ5g==\n"
+        "-----END PUBLIC KEY-----"
+    )
+    
+    def test_fingerprint_ignores_pem_wrapping(self):
+        """Test re-wrapped PEM text gives the same fingerprint"""
+        lines = self.PEM.splitlines()
+        unwrapped = "\n".join([lines[0], lines[1] + lines[2], lines[3]]) + "\n\n"
+        
+        assert key_fingerprint(self.PEM) == key_fingerprint(unwrapped)
+        assert len(key_fingerprint(self.PEM)) == 64
+    
+    def test_cosign_key_fingerprint(self):
+        """Test CosignKey.fingerprint() needs key content"""
+        key = CosignKey(description="test", key_url="https://example.org/cosign.pub")
+        assert key.fingerprint() is None
+        
+        key.key_content = self.PEM
+        assert key.fingerprint() == key_fingerprint(self.PEM)
+
+
+class TestVerifyBatch:
+    """Test grouped verification of images sharing a key"""
+    
+    @staticmethod
+    def _signature(digest):
+        return json.dumps([{'critical': {'image': {'docker-manifest-digest': f'sha256:{digest}'}}}]).encode()
+    
+    def test_shared_key_uses_one_cosign_run(self, verifier):
+        """Test images signed by the same key are verified in one call"""
+        stdout = b"\n".join([self._signature("a" * 64), self._signature("b" * 64)])
+        completed = subprocess.CompletedProcess(args=[], returncode=0, stdout=stdout, stderr=b"")
+        entries = [
+            ('bazzite-desktop', 'ghcr.io/ublue-os/bazzite:stable', None),
+            ('bazzite-handheld', 'ghcr.io/ublue-os/bazzite-deck:stable', "b" * 64),
+        ]
+        
+        with patch.object(verifier, '_resolve_key_content', return_value=('KEY', None)), \
+             patch('luxusb.utils.cosign_verifier.subprocess.run', return_value=completed) as run:
+            results = verifier.verify_batch(entries)
+        
+        assert run.call_count == 1
+        assert [r.verified for r in results] == [True, True]
+        assert [r.sha256 for r in results] == ["a" * 64, "b" * 64]
+    
+    def test_missing_binary_falls_back_per_image(self, verifier):
+        """Test an unrunnable cosign yields failed results instead of raising"""
+        entries = [('bazzite-desktop', 'ghcr.io/a:1', None), ('bazzite-handheld', 'ghcr.io/b:1', None)]
+        
+        with patch.object(verifier, '_resolve_key_content', return_value=('KEY', None)), \
+             patch('luxusb.utils.cosign_verifier.subprocess.run', side_effect=FileNotFoundError("cosign")):
+            results = verifier.verify_batch(entries)
+        
+        assert [r.verified for r in results] == [False, False]
+        assert all("cosign" in r.error_message for r in results)
+    
+    def test_batch_results_not_cached(self, verifier):
+        """Test unpinned batch verifications stay out of the result caches"""
+        stdout = b"\n".join([self._signature("a" * 64), self._signature("b" * 64)])
+        completed = subprocess.CompletedProcess(args=[], returncode=0, stdout=stdout, stderr=b"")
+        entries = [('bazzite-desktop', 'ghcr.io/a:1', None), ('bazzite-handheld', 'ghcr.io/b:1', None)]
+        
+        with patch.object(verifier, '_resolve_key_content', return_value=('KEY', None)), \
+             patch('luxusb.utils.cosign_verifier.subprocess.run', return_value=completed):
+            verifier.verify_batch(entries)
+        
+        assert not verifier._verify_cache
+        assert verifier._lookup_result("a" * 64, key_fingerprint('KEY')) is None
+    
+    def test_expected_digest_mismatch_fails(self, verifier):
+        """Test a signed digest that differs from expected_sha256 is rejected"""
+        completed = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout=self._signature("a" * 64), stderr=b""
+        )
+        
+        with patch.object(verifier, '_resolve_key_content', return_value=('KEY', None)), \
+             patch('luxusb.utils.cosign_verifier.subprocess.run', return_value=completed):
+            results = verifier.verify_batch([('bazzite-desktop', 'ghcr.io/a:1', "c" * 64)])
+        
+        assert results[0].verified is False
+    
+    def test_missing_key_reported_per_entry(self, verifier):
+        """Test entries without a key fail without running cosign"""
+        with patch.object(verifier, '_resolve_key_content', return_value=(None, "No cosign key configured for x")), \
+             patch('luxusb.utils.cosign_verifier.subprocess.run') as run:
+            results = verifier.verify_batch([('x', 'ghcr.io/a:1', None)])
+        
+        run.assert_not_called()
+        assert results[0].error_message == "No cosign key configured for x"
+    
+    def test_failure_stderr_decoded(self, verifier):
+        """Test cosign's raw stderr becomes a text error message"""
+        completed = subprocess.CompletedProcess(args=[], returncode=1, stdout=b"", stderr=b"no signatures found")
+        
+        with patch('luxusb.utils.cosign_verifier.subprocess.run', return_value=completed):
+            result = verifier._run_cosign_verify('ghcr.io/a:1', 'KEY')
+        
+        assert result.verified is False
+        assert result.error_message == "no signatures found"
+
+
+class TestOverlappedLookups:
+    """Test key download and digest lookup run concurrently"""
+    
+    def test_digest_lookup_overlaps_key_download(self, verifier):
+        """Test the digest is resolved while the key is being downloaded"""
+        import threading
+        
+        digest_started = threading.Event()
+        verifier.keys_data['slow'] = CosignKey(description="", key_url="https://example.org/cosign.pub")
+        
+        def slow_download(key_url):
+            # Only returns once the digest lookup is running in parallel
+            assert digest_started.wait(timeout=5)
+            return "KEY"
+        
+        def digest_lookup(image):
+            digest_started.set()
+            return None
+        
+        result = CosignVerification(verified=True, signature_info={})
+        with patch.object(verifier, 'download_public_key', side_effect=slow_download), \
+             patch.object(verifier, '_triangulate_digest', side_effect=digest_lookup), \
+             patch.object(verifier, '_run_cosign_verify', return_value=result):
+            verification = verifier.verify_container_image('slow', 'ghcr.io/a:1')
+        
+        assert verification.verified is True
+
+
+class TestExtractSha256:
+    """Test digest extraction from signature metadata"""
+    
+    def test_bare_digest_in_optional_field(self, verifier):
+        """Test a bare 64-hex annotation is returned lower-cased"""
+        info = {'optional': {'org.example.sha256': "AB" * 32}}
+        assert verifier._extract_sha256_from_signature(info) == "ab" * 32
+    
+    def test_embedded_digest_in_optional_field(self, verifier):
+        """Test a digest inside a longer annotation value is found"""
+        info = {'optional': {'image-digest': "sha256:" + "c" * 64}}
+        assert verifier._extract_sha256_from_signature(info) == "c" * 64
+    
+    def test_no_digest(self, verifier):
+        """Test metadata without a digest yields None"""
+        assert verifier._extract_sha256_from_signature({'optional': {'digest': 'none'}}) is None
+
+
+class TestTriangulatePinning:
+    """Test tag references are verified at their current digest"""
+    
+    def test_triangulate_not_cached(self, verifier):
+        """Test every lookup asks cosign, so a moved tag is noticed"""
+        outputs = iter(["d" * 64, "e" * 64])
+        
+        def triangulate(*args, **kwargs):
+            sig_ref = "ghcr.io/ublue-os/bazzite:sha256-" + next(outputs) + ".sig\n"
+            return subprocess.CompletedProcess(args=[], returncode=0, stdout=sig_ref, stderr="")
+        
+        with patch('luxusb.utils.cosign_verifier.subprocess.run', side_effect=triangulate) as run:
+            first = verifier._resolve_digest('ghcr.io/ublue-os/bazzite:stable')
+            second = verifier._resolve_digest('ghcr.io/ublue-os/bazzite:stable')
+        
+        assert (first, second) == ("d" * 64, "e" * 64)
+        assert run.call_count == 2
+    
+    def test_failed_triangulate(self, verifier):
+        """Test a failed triangulate resolves no digest"""
+        completed = subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="error")
+        
+        with patch('luxusb.utils.cosign_verifier.subprocess.run', return_value=completed):
+            assert verifier._resolve_digest('ghcr.io/a:1') is None
+    
+    def test_pin_keeps_registry_port(self):
+        """Test a registry port is not mistaken for a tag"""
+        assert CosignVerifier._pin('localhost:5000/os', "e" * 64) == "localhost:5000/os@sha256:" + "e" * 64
+        assert CosignVerifier._pin('ghcr.io/a/b:stable', "e" * 64) == "ghcr.io/a/b@sha256:" + "e" * 64
+        assert CosignVerifier._pin(PINNED_IMAGE, "e" * 64) == PINNED_IMAGE
+    
+    def test_uncached_tag_skips_triangulate(self, verifier):
+        """Test a first verify of a tag is cached under the digest cosign reports"""
+        signature_info = {'critical': {'image': {'docker-manifest-digest': 'sha256:' + "d" * 64}}}
+        result = CosignVerification(verified=True, signature_info=signature_info)
+        with patch.object(verifier, '_triangulate_digest') as triangulate, \
+             patch.object(verifier, '_run_cosign_verify', return_value=result) as run:
+            verifier.verify_container_image('bazzite', 'ghcr.io/ublue-os/bazzite:stable', key_content='KEY')
+        
+        triangulate.assert_not_called()
+        assert run.call_args[0][0] == 'ghcr.io/ublue-os/bazzite:stable'
+        assert list(verifier._verify_cache) == [
+            ('ghcr.io/ublue-os/bazzite:stable', "d" * 64, key_fingerprint('KEY'))
+        ]
+    
+    def test_cached_tag_reuses_matching_digest(self, verifier):
+        """Test a repeat verify triangulates once and hits the cache"""
+        signature_info = {'critical': {'image': {'docker-manifest-digest': 'sha256:' + "d" * 64}}}
+        result = CosignVerification(verified=True, signature_info=signature_info)
+        with patch.object(verifier, '_triangulate_digest', return_value="d" * 64) as triangulate, \
+             patch.object(verifier, '_run_cosign_verify', return_value=result) as run:
+            verifier.verify_container_image('bazzite', 'ghcr.io/ublue-os/bazzite:stable', key_content='KEY')
+            verifier.verify_container_image('bazzite', 'ghcr.io/ublue-os/bazzite:stable', key_content='KEY')
+        
+        assert triangulate.call_count == 1
+        assert run.call_count == 1
+    
+    def test_verifies_resolved_digest(self, verifier):
+        """Test a moved tag is verified at the digest it now points at"""
+        signature_info = {'critical': {'image': {'docker-manifest-digest': 'sha256:' + "d" * 64}}}
+        result = CosignVerification(verified=True, signature_info=signature_info)
+        with patch.object(verifier, '_triangulate_digest', return_value="e" * 64), \
+             patch.object(verifier, '_run_cosign_verify', return_value=result) as run:
+            verifier.verify_container_image('bazzite', 'ghcr.io/ublue-os/bazzite:stable', key_content='KEY')
+            verifier.verify_container_image('bazzite', 'ghcr.io/ublue-os/bazzite:stable', key_content='KEY')
+        
+        assert run.call_count == 2
+        assert run.call_args[0][0] == "ghcr.io/ublue-os/bazzite@sha256:" + "e" * 64
+        assert ('ghcr.io/ublue-os/bazzite:stable', "e" * 64, key_fingerprint('KEY')) in verifier._verify_cache
+
+
+class TestLazyKeys:
+    """Test cosign keys are built on first lookup"""
+    
+    def test_key_built_once_on_demand(self, verifier):
+        """Test get_key builds a CosignKey from the raw entry and reuses it"""
+        verifier._keys_raw = {'bazzite': {'description': 'Bazzite', 'key_url': 'https://example.org/cosign.pub'}}
+        verifier.keys_data.clear()
+        
+        assert verifier.is_distro_cosign_signed('bazzite')
+        assert 'bazzite' not in verifier.keys_data
+        
+        key = verifier.get_key('bazzite')
+        assert key.key_url == 'https://example.org/cosign.pub'
+        assert verifier.get_key('bazzite') is key
+        assert verifier.get_key('unknown') is None
+    
+    def test_construction_is_lazy(self):
+        """Test the key catalog and cosign probe wait for first use"""
+        with patch.object(CosignVerifier, '_load_keys', return_value={}) as load, \
+             patch.object(CosignVerifier, '_check_cosign_available', return_value=False) as probe:
+            verifier = CosignVerifier()
+            load.assert_not_called()
+            probe.assert_not_called()
+            
+            verifier.is_distro_cosign_signed('bazzite')
+            verifier.is_distro_cosign_signed('aurora')
+            assert verifier.cosign_available is False
+        
+        assert load.call_count == 1
+        assert probe.call_count == 1
+
+
+class TestContainerDigest:
+    """Test digest lookup through the resolved container tool"""
+    
+    @patch('luxusb.utils.cosign_verifier._CONTAINER_TOOL', '/usr/bin/podman')
+    def test_digest_from_manifest(self, verifier):
+        """Test the config digest is read with the one resolved tool"""
+        manifest = json.dumps({'config': {'digest': 'sha256:' + "f" * 64}}).encode()
+        completed = subprocess.CompletedProcess(args=[], returncode=0, stdout=manifest, stderr=b"")
+        
+        with patch('luxusb.utils.cosign_verifier.subprocess.run', return_value=completed) as run:
+            assert verifier.get_container_digest('ghcr.io/a:1') == "f" * 64
+        
+        assert run.call_count == 1
+        assert run.call_args[0][0][0] == '/usr/bin/podman'
+    
+    @patch('luxusb.utils.cosign_verifier._CONTAINER_TOOL', None)
+    def test_no_container_tool(self, verifier):
+        """Test no subprocess is spawned without docker or podman"""
+        with patch('luxusb.utils.cosign_verifier.subprocess.run') as run:
+            assert verifier.get_container_digest('ghcr.io/a:1') is None
+        
+        run.assert_not_called()
+
+
+class TestCacheTrust:
+    """Test caches writable by other accounts are not trusted"""
+    
+    def test_shared_results_db_ignored(self, verifier):
+        """Test a group-writable result database is not opened"""
+        verifier.results_db_path.write_bytes(b"")
+        verifier.results_db_path.chmod(0o664)
+        
+        assert verifier._open_results_db() is None
+        assert verifier._lookup_result("a" * 64, "fp") is None
+    
+    def test_shared_key_cache_ignored(self, verifier, tmp_path):
+        """Test a world-writable cached key is neither revalidated nor used offline"""
+        verifier.key_cache_dir = tmp_path / "keys"
+        key_url = "https://example.org/cosign.pub"
+        cache_path = verifier.key_cache_dir / f"{hashlib.sha256(key_url.encode()).hexdigest()}.pub"
+        verifier.key_cache_dir.mkdir(mode=0o700)
+        cache_path.write_text(TestKeyFingerprint.PEM)
+        cache_path.with_suffix('.json').write_text('{"etag": "x"}')
+        cache_path.chmod(0o666)
+        
+        session = Mock()
+        session.get.side_effect = OSError("offline")
+        with patch('luxusb.utils.cosign_verifier._get_session', return_value=session):
+            assert verifier.download_public_key(key_url) is None
+        
+        assert session.get.call_args[1]['headers'] == {}
@@ -90,6 +90,18 @@ class TestCustomISOValidator:
         assert result.is_valid is False
         assert result.error_message == "File does not exist"
     
+    def test_validate_directory_path(self, tmp_path):
+        """Test a directory named like an ISO is not a file"""
+        iso_dir = tmp_path / "folder.iso"
+        iso_dir.mkdir()
+        
+        validator = CustomISOValidator()
+        result = validator.validate_iso_file(iso_dir)
+        
+        assert result.is_valid is False
+        assert result.size_bytes == 0
+        assert result.error_message == "Path is not a file"
+    
     def test_validate_directory(self, tmp_path):
         """Test validation rejects directories"""
         test_dir = tmp_path / "not_a_file"
@@ -158,6 +170,89 @@ class TestCustomISOValidator:
         
         assert is_bootable is True
     
+    @patch('subprocess.run')
+    def test_validate_iso9660_header(self, mock_run, tmp_path):
+        """Test ISO 9660 signature is recognised without running 'file'"""
+        iso_file = tmp_path / "header.iso"
+        data = bytearray(20 * 1024 * 1024)
+        data[0x8001:0x8006] = b"CD001"
+        iso_file.write_bytes(bytes(data))
+        
+        validator = CustomISOValidator()
+        result = validator.validate_iso_file(iso_file)
+        
+        assert result.is_valid is True
+        mock_run.assert_not_called()
+    
+    @patch('subprocess.run')
+    def test_validate_hybrid_mbr_header(self, mock_run, tmp_path):
+        """Test hybrid MBR boot signature is recognised without running 'file'"""
+        img_file = tmp_path / "hybrid.img"
+        data = bytearray(20 * 1024 * 1024)
+        data[0x1FE:0x200] = b"\x55\xAA"
+        img_file.write_bytes(bytes(data))
+        
+        validator = CustomISOValidator()
+        result = validator.validate_iso_file(img_file)
+        
+        assert result.is_valid is True
+        mock_run.assert_not_called()
+    
+    @patch('luxusb.utils.custom_iso._ISOINFO_BIN', '/usr/bin/isoinfo')
+    @patch('subprocess.run')
+    def test_check_bootable_not_bootable(self, mock_run, tmp_path):
+        """Test isoinfo output without a boot record is reported"""
+        iso_file = tmp_path / "data.iso"
+        iso_file.write_bytes(b"x" * (20 * 1024 * 1024))
+        
+        mock_run.return_value = Mock(stdout="Volume id: DATA", returncode=0)
+        
+        validator = CustomISOValidator()
+        
+        assert validator.check_bootable(iso_file) is False
+        assert mock_run.call_args[0][0][0] == '/usr/bin/isoinfo'
+    
+    @patch('subprocess.run')
+    def test_check_bootable_el_torito(self, mock_run, tmp_path):
+        """Test the El Torito boot record is read without running isoinfo"""
+        iso_file = tmp_path / "boot.iso"
+        data = bytearray(20 * 1024 * 1024)
+        data[0x8000:0x8007] = b"\x01CD001\x01"
+        data[0x8800:0x8807] = b"\x00CD001\x01"
+        data[0x8807:0x881E] = b"EL TORITO SPECIFICATION"
+        iso_file.write_bytes(bytes(data))
+        
+        validator = CustomISOValidator()
+        
+        assert validator.check_bootable(iso_file) is True
+        mock_run.assert_not_called()
+    
+    @patch('subprocess.run')
+    def test_check_bootable_no_boot_record(self, mock_run, tmp_path):
+        """Test an ISO 9660 image without a boot record is not bootable"""
+        iso_file = tmp_path / "data.iso"
+        data = bytearray(20 * 1024 * 1024)
+        data[0x8000:0x8007] = b"\x01CD001\x01"
+        data[0x8800:0x8807] = b"\xffCD001\x01"
+        iso_file.write_bytes(bytes(data))
+        
+        validator = CustomISOValidator()
+        
+        assert validator.check_bootable(iso_file) is False
+        mock_run.assert_not_called()
+    
+    @patch('luxusb.utils.custom_iso._ISOINFO_BIN', None)
+    @patch('subprocess.run')
+    def test_check_bootable_without_isoinfo(self, mock_run, tmp_path):
+        """Test a missing isoinfo is detected without forking"""
+        iso_file = tmp_path / "test.iso"
+        iso_file.write_bytes(b"x" * (20 * 1024 * 1024))
+        
+        validator = CustomISOValidator()
+        
+        assert validator.check_bootable(iso_file) is True
+        mock_run.assert_not_called()
+    
     @patch('subprocess.run')
     def test_validate_format_fallback(self, mock_run, tmp_path):
         """Test format validation fallback when 'file' not available"""
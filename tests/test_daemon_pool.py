@@ -0,0 +1,62 @@
+"""
+Tests for the daemon worker pool used by the update workflows
+"""
+
+import threading
+
+import pytest
+
+from luxusb.utils._daemon_pool import DaemonThreadPool
+
+
+class TestDaemonThreadPool:
+    """Test DaemonThreadPool"""
+    
+    def test_submit_returns_result(self):
+        """Test jobs run and their results reach the future"""
+        pool = DaemonThreadPool(2)
+        
+        assert pool.submit(pow, 2, 10).result(timeout=5) == 1024
+        pool.shutdown()
+    
+    def test_exception_reaches_future(self):
+        """Test a failing job sets the exception on its future"""
+        pool = DaemonThreadPool(1)
+        
+        future = pool.submit(int, "not a number")
+        
+        with pytest.raises(ValueError):
+            future.result(timeout=5)
+        pool.shutdown()
+    
+    def test_workers_are_daemon_and_reused(self):
+        """Test workers are daemon threads and are reused across submits"""
+        pool = DaemonThreadPool(4)
+        
+        threads = {pool.submit(threading.current_thread).result(timeout=5) for _ in range(5)}
+        
+        assert all(t.daemon for t in threads)
+        assert len(pool._threads) == 1
+        pool.shutdown()
+    
+    def test_shutdown_cancels_pending(self):
+        """Test shutdown(cancel_futures=True) cancels jobs that haven't started"""
+        pool = DaemonThreadPool(1)
+        started = threading.Event()
+        release = threading.Event()
+        
+        def block():
+            started.set()
+            return release.wait(5)
+        
+        running = pool.submit(block)
+        started.wait(5)
+        pending = pool.submit(pow, 2, 2)
+        
+        pool.shutdown(cancel_futures=True)
+        release.set()
+        
+        assert running.result(timeout=5) is True
+        assert pending.cancelled()
+        with pytest.raises(RuntimeError):
+            pool.submit(pow, 2, 2)
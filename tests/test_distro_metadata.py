@@ -2,12 +2,22 @@
 Tests for Phase 2.4: Dynamic Distribution Metadata
 """
 
+import os
 import pytest
 import json
 from pathlib import Path
 from unittest.mock import Mock, patch, mock_open
 from luxusb.utils.distro_json_loader import DistroJSONLoader, load_all_distros, get_distro_by_id
 from luxusb.utils.distro_manager import Distro, DistroRelease, DistroManager
+from luxusb.utils import distro_json_loader, distro_manager
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep the distro cache out of the real home directory"""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(distro_json_loader, "_loader", None)
+    monkeypatch.setattr(distro_manager, "_distro_manager_instance", None)
 
 
 class TestDistroJSONLoader:
@@ -85,6 +95,61 @@ class TestDistroJSONLoader:
         
         assert nonexistent is None
     
+    def test_load_all_skips_non_json_entries(self, tmp_path):
+        """Test load_all only picks up regular *.json files"""
+        source = DistroJSONLoader().data_dir / "ubuntu.json"
+        (tmp_path / "ubuntu.json").write_bytes(source.read_bytes())
+        (tmp_path / "fedora.json.disabled").write_text("{}")
+        (tmp_path / "folder.json").mkdir()
+        
+        loader = DistroJSONLoader(data_dir=tmp_path)
+        loader.cache_path = tmp_path / "cache" / "distros.cache.json"
+        distros = loader.load_all()
+        
+        assert [d.id for d in distros] == ['ubuntu']
+    
+    def test_load_all_uses_disk_cache(self, tmp_path):
+        """Test a second load_all reads the cache until a file changes"""
+        data_dir = tmp_path / "distros"
+        data_dir.mkdir()
+        ubuntu = data_dir / "ubuntu.json"
+        ubuntu.write_bytes((DistroJSONLoader().data_dir / "ubuntu.json").read_bytes())
+        
+        loader = DistroJSONLoader(data_dir=data_dir)
+        loader.cache_path = tmp_path / "distros.cache.json"
+        first = loader.load_all()
+        
+        with patch.object(loader, 'load_distro') as load_distro:
+            cached = loader.load_all()
+        load_distro.assert_not_called()
+        assert cached == first
+        
+        # Touching a file changes the fingerprint and forces a re-parse
+        os.utime(ubuntu, ns=(0, 0))
+        with patch.object(loader, 'load_distro', return_value=None) as load_distro:
+            assert loader.load_all() == []
+        load_distro.assert_called_once()
+    
+    def test_shared_disk_cache_ignored(self, tmp_path):
+        """Test a cache file other accounts can write is not trusted"""
+        loader = DistroJSONLoader()
+        loader.cache_path = tmp_path / "distros.cache.json"
+        loader.load_all()
+        loader.cache_path.chmod(0o666)
+        
+        with patch.object(loader, 'load_distro', return_value=None) as load_distro:
+            assert loader.load_all() == []
+        assert load_distro.called
+    
+    def test_load_distro_invalid_json(self, tmp_path):
+        """Test a malformed JSON file is rejected without raising"""
+        bad_file = tmp_path / "broken.json"
+        bad_file.write_text('{"id": "broken",')
+        
+        loader = DistroJSONLoader(data_dir=tmp_path)
+        
+        assert loader.load_distro(bad_file) is None
+    
     def test_parse_release_valid(self):
         """Test parsing valid release data"""
         loader = DistroJSONLoader()
@@ -135,6 +200,72 @@ class TestDistroJSONLoader:
         with pytest.raises(ValueError, match="Invalid SHA256"):
             loader._parse_release(data)
     
+    def test_parse_release_non_hex_sha256(self):
+        """Test a 64-character checksum must also be hexadecimal"""
+        loader = DistroJSONLoader()
+        
+        data = {
+            'version': '24.04',
+            'release_date': '2024-04-25',
+            'iso_url': 'https://example.com/ubuntu.iso',
+            'sha256': 'z' * 64,
+            'size_mb': 3500
+        }
+        
+        with pytest.raises(ValueError, match="Invalid SHA256"):
+            loader._parse_release(data)
+    
+    def test_read_json_large_file(self, tmp_path):
+        """Test files above the mmap threshold parse the same as small ones"""
+        loader = DistroJSONLoader(data_dir=tmp_path)
+        large = tmp_path / "large.json"
+        large.write_text(json.dumps({'id': 'large', 'padding': 'x' * (loader.MMAP_THRESHOLD + 1)}))
+        
+        data = loader._read_json(large)
+        
+        assert data['id'] == 'large'
+        assert len(data['padding']) == loader.MMAP_THRESHOLD + 1
+    
+    def test_load_distro_skips_invalid_releases(self, tmp_path):
+        """Test invalid releases are dropped while valid ones are kept"""
+        good = {'version': '2', 'release_date': '2024-01-01', 'iso_url': 'https://example.com/2.iso',
+                'sha256': 'b' * 64, 'size_mb': 1000}
+        bad = dict(good, version='1', sha256='not-a-checksum')
+        distro_file = tmp_path / "example.json"
+        distro_file.write_text(json.dumps({
+            'id': 'example', 'name': 'Example', 'description': 'Example distro',
+            'homepage': 'https://example.com', 'category': 'Desktop',
+            'popularity_rank': 50, 'releases': [good, bad, "junk"]
+        }))
+        
+        distro = DistroJSONLoader(data_dir=tmp_path).load_distro(distro_file)
+        
+        assert [r.version for r in distro.releases] == ['2']
+    
+    def test_repeated_fields_interned(self):
+        """Test shared field values are the same string object across distros"""
+        loader = DistroJSONLoader()
+        ubuntu = loader.get_distro_by_id('ubuntu')
+        debian = loader.get_distro_by_id('debian')
+        
+        assert ubuntu.latest_release.architecture is debian.latest_release.architecture
+        assert ubuntu.family is debian.family
+    
+    def test_null_fields_not_interned(self, tmp_path):
+        """Test null category and architecture load as None instead of failing"""
+        data = json.loads((DistroJSONLoader().data_dir / "ubuntu.json").read_text())
+        data['category'] = None
+        for release in data['releases']:
+            release['architecture'] = None
+        path = tmp_path / "ubuntu.json"
+        path.write_text(json.dumps(data))
+        
+        distro = DistroJSONLoader(data_dir=tmp_path).load_distro(path)
+        
+        assert distro is not None
+        assert distro.category is None
+        assert distro.latest_release.architecture is None
+    
     def test_loader_caching(self):
         """Test that loader caches distros"""
         loader = DistroJSONLoader()
@@ -148,6 +279,18 @@ class TestDistroJSONLoader:
         # Should be the same object
         assert ubuntu1 is ubuntu2
         assert 'ubuntu' in loader._cache
+    
+    def test_load_all_fills_cache(self, tmp_path):
+        """Test get_distro_by_id is served from load_all without file access"""
+        loader = DistroJSONLoader()
+        loader.cache_path = tmp_path / "distros.cache.json"
+        distros = loader.load_all()
+        
+        with patch.object(loader, 'load_distro') as load_distro:
+            assert loader.get_distro_by_id('ubuntu') is next(d for d in distros if d.id == 'ubuntu')
+            assert loader.get_distro_by_id('nonexistent-distro') is None
+        
+        load_distro.assert_not_called()
 
 
 class TestDistroManager:
@@ -185,6 +328,28 @@ class TestDistroManager:
         nonexistent = manager.get_distro_by_id('nonexistent')
         assert nonexistent is None
     
+    def test_manager_loads_lazily(self):
+        """Test a by-id lookup doesn't load every distro"""
+        manager = DistroManager()
+        
+        with patch.object(manager._loader, 'load_all', wraps=manager._loader.load_all) as load_all:
+            ubuntu = manager.get_distro_by_id('ubuntu')
+            load_all.assert_not_called()
+            
+            assert manager.get_all_distros()
+            assert manager.get_popular_distros(limit=1)
+        
+        assert ubuntu is not None and ubuntu.id == 'ubuntu'
+        assert load_all.call_count == 1
+    
+    def test_search_distros(self):
+        """Test search matches name or description case-insensitively"""
+        manager = DistroManager()
+        
+        results = manager.search_distros('UBUNTU')
+        assert any(d.id == 'ubuntu' for d in results)
+        assert manager.search_distros('no-such-distro-anywhere') == []
+    
     def test_get_popular_distros(self):
         """Test getting popular distros"""
         manager = DistroManager()
@@ -192,6 +357,8 @@ class TestDistroManager:
         popular = manager.get_popular_distros(limit=3)
         assert len(popular) <= 3
         assert all(isinstance(d, Distro) for d in popular)
+        ranks = [d.popularity_rank for d in popular]
+        assert ranks == sorted(ranks)
 
 
 class TestJSONSchema:
@@ -226,6 +393,18 @@ class TestJSONSchema:
         assert 'popularity_rank' in required
         assert 'releases' in required
     
+    def test_validate_schema_reuses_validator(self):
+        """Test the schema validator is built once for every file"""
+        pytest.importorskip("jsonschema")
+        loader = DistroJSONLoader()
+        
+        assert loader.validate_schema(loader.data_dir / "ubuntu.json") is True
+        validator = loader._validator
+        assert validator is not None
+        
+        assert loader.validate_schema(loader.data_dir / "fedora.json") is True
+        assert loader._validator is validator
+    
     def test_existing_jsons_are_valid(self):
         """Test that all existing JSON files are valid"""
         loader = DistroJSONLoader()
@@ -319,6 +498,26 @@ class TestBackwardCompatibility:
         assert hasattr(release, 'architecture')
         assert hasattr(release, 'mirrors')
         assert hasattr(release, 'size_gb')
+    
+    def test_release_iso_filename(self):
+        """Test iso_filename is the last segment of iso_url"""
+        release = DistroRelease(
+            version="24.04",
+            release_date="2024-04-25",
+            iso_url="https://releases.example.org/24.04/example-24.04-desktop-amd64.iso",
+            sha256="0" * 64,
+            size_mb=5800
+        )
+        
+        assert release.iso_filename == "example-24.04-desktop-amd64.iso"
+    
+    def test_slotted_dataclasses_pickle(self, mock_distro):
+        """Test distro objects have no __dict__ and survive a pickle round trip"""
+        import pickle
+        
+        assert not hasattr(mock_distro, '__dict__')
+        assert not hasattr(mock_distro.releases[0], '__dict__')
+        assert pickle.loads(pickle.dumps(mock_distro)) == mock_distro
 
 
 class TestPhase24Summary:
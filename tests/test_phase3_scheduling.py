@@ -103,6 +103,42 @@ class TestUpdateScheduler:
         assert scheduler.should_skip_version('ubuntu', '24.10') is False
         assert scheduler.should_skip_version('fedora', '41') is False
     
+    def test_get_skipped_versions(self, scheduler):
+        """Test getting all skipped versions at once"""
+        assert scheduler.get_skipped_versions() == set()
+        
+        scheduler.add_skip_version('ubuntu', '24.04')
+        scheduler.add_skip_version('linux-mint', '22')
+        
+        skipped = scheduler.get_skipped_versions()
+        assert skipped == {('ubuntu', '24.04'), ('linux-mint', '22')}
+        assert ('fedora', '41') not in skipped
+    
+    def test_remove_skip_version(self, scheduler):
+        """Test removing a single skipped version"""
+        scheduler.add_skip_version('ubuntu', '24.04')
+        scheduler.add_skip_version('fedora', '41')
+        
+        assert scheduler.remove_skip_version('ubuntu', '24.04') is True
+        assert scheduler.remove_skip_version('ubuntu', '24.04') is False
+        
+        assert scheduler.should_skip_version('ubuntu', '24.04') is False
+        assert scheduler.should_skip_version('fedora', '41') is True
+        assert scheduler.preferences['skip_versions'] == ['fedora-41']
+    
+    def test_hyphenated_version_survives_reload(self, scheduler):
+        """Test skipped versions containing hyphens still match after a reload"""
+        scheduler.add_skip_version('arch', '2024.01-1')
+        scheduler.add_skip_version('linux-mint', '9.4-20240501')
+        
+        reloaded = UpdateScheduler(config_dir=scheduler.config_dir)
+        
+        assert reloaded.should_skip_version('arch', '2024.01-1') is True
+        assert reloaded.should_skip_version('linux-mint', '9.4-20240501') is True
+        assert reloaded.should_skip_version('arch', '2024.01') is False
+        assert reloaded.remove_skip_version('arch', '2024.01-1') is True
+        assert reloaded.preferences['skip_versions'] == ['linux-mint-9.4-20240501']
+    
     def test_mark_check_completed(self, scheduler):
         """Test marking check as completed"""
         # Set remind later first
@@ -188,6 +224,23 @@ class TestUpdateScheduler:
         # Should have same preferences
         assert scheduler2.preferences.get('skip_until_date') is not None
         assert len(scheduler2.preferences.get('skip_versions', [])) == 1
+    
+    def test_reload_if_changed(self, temp_config_dir):
+        """Test long-lived scheduler picks up edits from another instance"""
+        scheduler1 = UpdateScheduler(config_dir=temp_config_dir)
+        scheduler1.mark_check_completed()
+        
+        # Nothing changed since our own save
+        assert scheduler1.reload_if_changed() is False
+        
+        # Another instance edits the preferences file
+        scheduler2 = UpdateScheduler(config_dir=temp_config_dir)
+        scheduler2.set_check_interval_days(14)
+        scheduler2.add_skip_version('ubuntu', '24.04')
+        
+        assert scheduler1.reload_if_changed() is True
+        assert scheduler1.get_check_interval_days() == 14
+        assert scheduler1.should_skip_version('ubuntu', '24.04') is True
 
 
 class TestNetworkDetector: